@@ -6,8 +6,9 @@ EDITABLE: This file is the editable version of `conftest.py`. Script
 flag ``-n`` / ``--new``).
 
 .. note::
-    Fixture method `urlmock.apply` uses beta feature
-    `responses._add_from_file` (as of `responses` version 0.23.3).
+    Fixture method `urlmock.apply` reads mock files in the format of
+    beta feature `responses._add_from_file` (as of `responses` version
+    0.23.3).
 """
 
 # SPDX-FileCopyrightText: 2023 Lauri Salmela <lauri.m.salmela@gmail.com>
@@ -17,8 +18,11 @@ flag ``-n`` / ``--new``).
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
+import functools
 import hashlib
 import re
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timezone
 from typing import Union
 
@@ -75,6 +79,53 @@ def db_record_count():
     return _db_record_count
 
 
+@pytest.fixture(scope='package')
+def db_column_counts():
+    """
+    Get record counts by values of `columns` in Filing table.
+
+    Keys of the returned dict are plain values for a single column and
+    tuples of values for several columns.
+    """
+    def _db_column_counts(db_path, *columns):
+        cols = ', '.join(columns)
+        sql = f"SELECT {cols}, COUNT(*) FROM Filing GROUP BY {cols}"  # noqa: S608
+        with closing(sqlite3.connect(db_path)) as con:
+            rows = con.execute(sql)
+            return {
+                (row[0] if len(columns) == 1 else row[:-1]): row[-1]
+                for row in rows
+                }
+    return _db_column_counts
+
+
+@pytest.fixture(scope='package')
+def one_filing_query():
+    """
+    Get `get_filings` with a limit of one filing and no sorting.
+
+    Flags are set as `GET_ONLY_FILINGS`.
+    """
+    return functools.partial(
+        xf.get_filings, sort=None, limit=1, flags=xf.GET_ONLY_FILINGS)
+
+
+@pytest.fixture
+def mock_response(request):
+    """
+    Activate the mock response fixture named by the parameter.
+
+    Use with indirect parametrization.
+    """
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def no_views(monkeypatch):
+    """Do not create SQLite views in databases of `to_sqlite` calls."""
+    monkeypatch.setattr(xf.options, 'views', None)
+
+
 @pytest.fixture(scope='module')
 def mock_response_data():
     """Arbitrary data for mock download, 1000 chars."""
@@ -179,6 +230,66 @@ def get_oldest3_fi_ent_vmessages_filingset(urlmock):
     return _get_oldest3_fi_ent_vmessages_filingset
 
 
+@pytest.fixture(scope='package')
+def oldest3_fi_filingset(get_oldest3_fi_filingset):
+    """
+    Shared FilingSet from mock response oldest3_fi.
+
+    Do not mutate.
+    """
+    return get_oldest3_fi_filingset()
+
+
+@pytest.fixture(scope='package')
+def oldest3_fi_entities_filingset(get_oldest3_fi_entities_filingset):
+    """
+    Shared FilingSet from mock response oldest3_fi_entities.
+
+    Do not mutate.
+    """
+    return get_oldest3_fi_entities_filingset()
+
+
+@pytest.fixture(scope='package')
+def oldest3_fi_vmessages_filingset(get_oldest3_fi_vmessages_filingset):
+    """
+    Shared FilingSet from mock response oldest3_fi_vmessages.
+
+    Do not mutate.
+    """
+    return get_oldest3_fi_vmessages_filingset()
+
+
+@pytest.fixture(scope='package')
+def oldest3_fi_ent_vmessages_filingset(
+        get_oldest3_fi_ent_vmessages_filingset):
+    """
+    Shared FilingSet from mock response ``oldest3_fi_ent_vmessages``.
+
+    Do not mutate.
+    """
+    return get_oldest3_fi_ent_vmessages_filingset()
+
+
+@pytest.fixture(scope='package')
+def asml22en_filingset(urlmock):
+    """
+    Shared FilingSet from mock response ``asml22en``.
+
+    Do not mutate.
+    """
+    with responses.RequestsMock() as rsps:
+        urlmock.apply(rsps, 'asml22en')
+        return xf.get_filings(
+            filters={
+                'filing_index': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
+                },
+            sort=None,
+            limit=1,
+            flags=xf.GET_ONLY_FILINGS
+            )
+
+
 @pytest.fixture(scope='package')
 def dummy_api_request():
     """Dummy APIRequest object."""
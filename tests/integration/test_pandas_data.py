@@ -16,144 +16,165 @@ import pytest
 
 import xbrl_filings_api as xf
 
+ENENTO20EN_END_DATE = pd.Timestamp('2020-12-31')
+ENENTO20EN_ADDED_TIME = pd.Timestamp('2021-05-18 00:00:00')
+ENENTO20EN_PROCESSED_TIME = pd.Timestamp('2023-01-18 11:02:18.936351')
+
+
+@pytest.fixture(scope='module')
+def oldest3_fi_df(oldest3_fi_filingset):
+    """DataFrame of `oldest3_fi_filingset` with default parameters."""
+    pd_data = oldest3_fi_filingset.get_pandas_data(
+        attr_names=None,
+        with_entity=False,
+        strip_timezone=True,
+        date_as_datetime=True,
+        include_urls=False,
+        include_paths=False
+        )
+    return pd.DataFrame(data=pd_data)
+
+
+@pytest.fixture(scope='module')
+def oldest3_fi_with_entity_df(oldest3_fi_filingset):
+    """DataFrame of `oldest3_fi_filingset` with with_entity=True."""
+    pd_data = oldest3_fi_filingset.get_pandas_data(
+        attr_names=None,
+        with_entity=True,
+        strip_timezone=True,
+        date_as_datetime=True,
+        include_urls=False,
+        include_paths=False
+        )
+    return pd.DataFrame(data=pd_data)
+
+
+@pytest.fixture(scope='module')
+def oldest3_fi_entities_with_entity_df(oldest3_fi_entities_filingset):
+    """
+    DataFrame of `oldest3_fi_entities_filingset` with with_entity=True.
+    """
+    pd_data = oldest3_fi_entities_filingset.get_pandas_data(
+        attr_names=None,
+        with_entity=True,
+        strip_timezone=True,
+        date_as_datetime=True,
+        include_urls=False,
+        include_paths=False
+        )
+    return pd.DataFrame(data=pd_data)
+
+
+@pytest.fixture(scope='module')
+def oldest3_fi_entities_df(oldest3_fi_entities_filingset):
+    """DataFrame of entities of `oldest3_fi_entities_filingset`."""
+    pd_data = oldest3_fi_entities_filingset.entities.get_pandas_data(
+        attr_names=None,
+        strip_timezone=True,
+        date_as_datetime=True,
+        include_urls=False
+        )
+    return pd.DataFrame(data=pd_data)
+
+
+@pytest.fixture(scope='module')
+def oldest3_fi_vmessages_df(oldest3_fi_vmessages_filingset):
+    """
+    DataFrame of validation messages of
+    `oldest3_fi_vmessages_filingset`.
+    """
+    fs = oldest3_fi_vmessages_filingset
+    pd_data = fs.validation_messages.get_pandas_data(
+        attr_names=None,
+        strip_timezone=True,
+        date_as_datetime=True,
+        include_urls=False
+        )
+    return pd.DataFrame(data=pd_data)
+
+
+def _row(df, api_id):
+    """Get the row of `df` with column ``api_id`` value `api_id`."""
+    matches = df['api_id'].to_numpy() == api_id
+    assert matches.any()
+    return df.iloc[matches.argmax()]
+
 
 class TestFilingSet_get_pandas_data:
     """Test method FilingSet.get_pandas_data."""
 
-    def test_defaults(self, get_oldest3_fi_filingset):
+    def test_defaults(self, oldest3_fi_df):
         """
         Test default parameter values for FilingSet.get_pandas_data.
         """
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
-        pd_data = fs.get_pandas_data(
-            attr_names=None,
-            with_entity=False,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False,
-            include_paths=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento20en = df[df['api_id'] == '710']
-        i = enento20en.index.array[0]
-        assert enento20en.at[i, 'country'] == 'FI'
-        assert enento20en.at[i, 'filing_index'] == (
+        df = oldest3_fi_df
+        enento20en = _row(df, '710')
+        assert enento20en['country'] == 'FI'
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
-        assert enento20en.at[i, 'language'] == 'en'
-        assert enento20en.at[i, 'error_count'] == 0
-        assert enento20en.at[i, 'inconsistency_count'] == 19
-        assert enento20en.at[i, 'warning_count'] == 0
-        assert 'added_time_str' not in enento20en.columns.array
-        assert 'processed_time_str' not in enento20en.columns.array
-        assert 'entity_api_id' not in enento20en.columns.array
-        assert 'json_url' not in enento20en.columns.array
-        assert 'package_url' not in enento20en.columns.array
-        assert 'viewer_url' not in enento20en.columns.array
-        assert 'xhtml_url' not in enento20en.columns.array
-        assert 'request_url' not in enento20en.columns.array
-        assert 'json_download_path' not in enento20en.columns.array
-        assert 'package_download_path' not in enento20en.columns.array
-        assert 'xhtml_download_path' not in enento20en.columns.array
-        assert enento20en.at[i, 'package_sha256'] == (
+        assert enento20en['language'] == 'en'
+        assert enento20en['error_count'] == 0
+        assert enento20en['inconsistency_count'] == 19
+        assert enento20en['warning_count'] == 0
+        assert not {
+            'added_time_str', 'processed_time_str', 'entity_api_id',
+            'json_url', 'package_url', 'viewer_url', 'xhtml_url',
+            'request_url', 'json_download_path', 'package_download_path',
+            'xhtml_download_path', 'entity', 'validation_messages'
+            } & set(df.columns)
+        assert enento20en['package_sha256'] == (
             'ab0c60224c225ba3921188514ecd6c37af6a947f68a5c3a0c6eb34abfaae822b')
-        assert 'entity' not in enento20en.columns.array
-        assert 'validation_messages' not in enento20en.columns.array
-        assert '507' in df['api_id'].array
-        assert '1495' in df['api_id'].array
+        assert {'507', '1495'} <= set(df['api_id'])
 
-    def test_with_entity_true(self, get_oldest3_fi_entities_filingset):
+    def test_with_entity_true(self, oldest3_fi_entities_with_entity_df):
         """Test with_entity=True."""
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
-        pd_data = fs.get_pandas_data(
-            attr_names=None,
-            with_entity=True,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False,
-            include_paths=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento20en = df[df['api_id'] == '710']
-        i = enento20en.index.array[0]
-        assert enento20en.at[i, 'filing_index'] == (
+        df = oldest3_fi_entities_with_entity_df
+        enento20en = _row(df, '710')
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
-        assert 'entity_api_id' not in enento20en.columns.array
-        assert enento20en.at[i, 'entity.api_id'] == '548'
-        assert enento20en.at[i, 'entity.identifier'] == '743700EPLUWXE25HGM03'
-        assert enento20en.at[i, 'entity.name'] == 'Enento Group Oyj'
-        assert 'entity.api_entity_filings_url' not in enento20en.columns.array
-        assert isinstance(enento20en.at[i, 'entity.query_time'], pd.Timestamp)
-        assert 'entity.request_url' not in enento20en.columns.array
-        assert 'entity.filings' not in enento20en.columns.array
-        assert 'entity' not in enento20en.columns.array
-        assert '507' in df['api_id'].array
-        assert '1495' in df['api_id'].array
+        assert 'entity_api_id' not in df.columns
+        assert enento20en['entity.api_id'] == '548'
+        assert enento20en['entity.identifier'] == '743700EPLUWXE25HGM03'
+        assert enento20en['entity.name'] == 'Enento Group Oyj'
+        assert 'entity.api_entity_filings_url' not in df.columns
+        assert isinstance(enento20en['entity.query_time'], pd.Timestamp)
+        assert not {
+            'entity.request_url', 'entity.filings', 'entity'
+            } & set(df.columns)
+        assert {'507', '1495'} <= set(df['api_id'])
 
     @pytest.mark.date
-    def test_dates(self, get_oldest3_fi_filingset):
+    def test_dates(self, oldest3_fi_df):
         """Test date columns."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
-        pd_data = fs.get_pandas_data(
-            attr_names=None,
-            with_entity=False,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False,
-            include_paths=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento20en = df[df['api_id'] == '710']
-        i = enento20en.index.array[0]
-        assert enento20en.at[i, 'last_end_date'] == pd.Timestamp('2020-12-31')
-        assert enento20en.at[i, 'reporting_date'] == pd.Timestamp('2020-12-31')
-        assert isinstance(enento20en.at[i, 'query_time'], pd.Timestamp)
+        df = oldest3_fi_df
+        enento20en = _row(df, '710')
+        assert enento20en['last_end_date'] == ENENTO20EN_END_DATE
+        assert enento20en['reporting_date'] == ENENTO20EN_END_DATE
+        assert isinstance(enento20en['query_time'], pd.Timestamp)
 
     @pytest.mark.datetime
-    def test_datetimes(self, get_oldest3_fi_filingset):
+    def test_datetimes(self, oldest3_fi_df):
         """Test datetime columns."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
-        pd_data = fs.get_pandas_data(
-            attr_names=None,
-            with_entity=False,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False,
-            include_paths=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento20en = df[df['api_id'] == '710']
-        i = enento20en.index.array[0]
-        assert enento20en.at[i, 'added_time'] == (
-            pd.Timestamp('2021-05-18 00:00:00'))
-        assert enento20en.at[i, 'processed_time'] == (
-            pd.Timestamp('2023-01-18 11:02:18.936351'))
-        assert isinstance(enento20en.at[i, 'query_time'], pd.Timestamp)
-
-    def test_with_entity_true_no_entity(self, get_oldest3_fi_filingset):
+        df = oldest3_fi_df
+        enento20en = _row(df, '710')
+        assert enento20en['added_time'] == ENENTO20EN_ADDED_TIME
+        assert enento20en['processed_time'] == ENENTO20EN_PROCESSED_TIME
+        assert isinstance(enento20en['query_time'], pd.Timestamp)
+
+    def test_with_entity_true_no_entity(self, oldest3_fi_with_entity_df):
         """Test with_entity=True but no entities in FilingSet."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
-        pd_data = fs.get_pandas_data(
-            attr_names=None,
-            with_entity=True,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False,
-            include_paths=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento20en = df[df['api_id'] == '710']
-        i = enento20en.index.array[0]
-        assert 'entity_api_id' not in enento20en.columns.array
-        assert enento20en.at[i, 'entity.api_id'] is None
-        assert enento20en.at[i, 'entity.identifier'] is None
-        assert enento20en.at[i, 'entity.name'] is None
-        assert 'entity.api_entity_filings_url' not in enento20en.columns.array
-        assert enento20en.at[i, 'entity.query_time'] is None
-        assert 'entity.request_url' not in enento20en.columns.array
-        assert 'entity.filings' not in enento20en.columns.array
-        assert 'entity' not in enento20en.columns.array
-        assert '507' in df['api_id'].array
-        assert '1495' in df['api_id'].array
+        df = oldest3_fi_with_entity_df
+        enento20en = _row(df, '710')
+        assert 'entity_api_id' not in df.columns
+        assert enento20en['entity.api_id'] is None
+        assert enento20en['entity.identifier'] is None
+        assert enento20en['entity.name'] is None
+        assert 'entity.api_entity_filings_url' not in df.columns
+        assert enento20en['entity.query_time'] is None
+        assert not {
+            'entity.request_url', 'entity.filings', 'entity'
+            } & set(df.columns)
+        assert {'507', '1495'} <= set(df['api_id'])
 
 
 class TestResourceCollection_entities_get_pandas_data:
@@ -162,29 +183,19 @@ class TestResourceCollection_entities_get_pandas_data:
     FilingSet.entities.
     """
 
-    def test_e_defaults(self, get_oldest3_fi_entities_filingset):
+    def test_e_defaults(self, oldest3_fi_entities_df):
         """
         Test default parameter values for
         ResourceCollection[entities].get_pandas_data.
         """
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
-        pd_data = fs.entities.get_pandas_data(
-            attr_names=None,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        enento = df[df['api_id'] == '548']
-        i = enento.index.array[0]
-        assert enento.at[i, 'identifier'] == '743700EPLUWXE25HGM03'
-        assert enento.at[i, 'name'] == 'Enento Group Oyj'
-        assert 'api_entity_filings_url' not in enento.columns.array
-        assert isinstance(enento.at[i, 'query_time'], pd.Timestamp)
-        assert 'request_url' not in enento.columns.array
-        assert 'filings' not in enento.columns.array
-        assert '383' in df['api_id'].array
-        assert '1120' in df['api_id'].array
+        df = oldest3_fi_entities_df
+        enento = _row(df, '548')
+        assert enento['identifier'] == '743700EPLUWXE25HGM03'
+        assert enento['name'] == 'Enento Group Oyj'
+        assert 'api_entity_filings_url' not in df.columns
+        assert isinstance(enento['query_time'], pd.Timestamp)
+        assert not {'request_url', 'filings'} & set(df.columns)
+        assert {'383', '1120'} <= set(df['api_id'])
 
 
 class TestResourceCollection_validation_messages_get_pandas_data:
@@ -193,7 +204,8 @@ class TestResourceCollection_validation_messages_get_pandas_data:
     FilingSet.validation_messages.
     """
 
-    def test_vm_defaults(self, get_oldest3_fi_vmessages_filingset):
+    def test_vm_defaults(
+            self, oldest3_fi_vmessages_filingset, oldest3_fi_vmessages_df):
         """
         Test default parameter values
         for ResourceCollection[validation_messages].get_pandas_data.
@@ -212,34 +224,25 @@ class TestResourceCollection_validation_messages_get_pandas_data:
             'computed sum 537,400,000 context c-3 unit u-1 '
             'unreportedContributingItems none'
             )
-        fs: xf.FilingSet = get_oldest3_fi_vmessages_filingset()
+        fs: xf.FilingSet = oldest3_fi_vmessages_filingset
         vmsg_5464: xf.ValidationMessage = next(filter(
             lambda vmsg: vmsg.api_id == '5464', fs.validation_messages))
-        pd_data = fs.validation_messages.get_pandas_data(
-            attr_names=None,
-            strip_timezone=True,
-            date_as_datetime=True,
-            include_urls=False
-            )
-        df = pd.DataFrame(data=pd_data)
-        assert len(df.index.array) == len(e_api_ids)
-        enento = df[df['api_id'] == '5464']
-        i = enento.index.array[0]
-        assert enento.at[i, 'severity'] == 'INCONSISTENCY'
-        assert enento.at[i, 'text'] == e_5464_text
-        assert enento.at[i, 'code'] == 'xbrl.5.2.5.2:calcInconsistency'
-        assert enento.at[i, 'filing_api_id'] == '507'
-        assert enento.at[i, 'calc_computed_sum'] == vmsg_5464.calc_computed_sum
-        assert enento.at[i, 'calc_reported_sum'] == vmsg_5464.calc_reported_sum
-        assert enento.at[i, 'calc_context_id'] == vmsg_5464.calc_context_id
-        assert enento.at[i, 'calc_line_item'] == vmsg_5464.calc_line_item
-        assert enento.at[i, 'calc_short_role'] == vmsg_5464.calc_short_role
-        assert enento.at[i, 'calc_unreported_items'] == (
+        df = oldest3_fi_vmessages_df
+        assert len(df) == len(e_api_ids)
+        enento = _row(df, '5464')
+        assert enento['severity'] == 'INCONSISTENCY'
+        assert enento['text'] == e_5464_text
+        assert enento['code'] == 'xbrl.5.2.5.2:calcInconsistency'
+        assert enento['filing_api_id'] == '507'
+        assert enento['calc_computed_sum'] == vmsg_5464.calc_computed_sum
+        assert enento['calc_reported_sum'] == vmsg_5464.calc_reported_sum
+        assert enento['calc_context_id'] == vmsg_5464.calc_context_id
+        assert enento['calc_line_item'] == vmsg_5464.calc_line_item
+        assert enento['calc_short_role'] == vmsg_5464.calc_short_role
+        assert enento['calc_unreported_items'] == (
             vmsg_5464.calc_unreported_items)
-        assert enento.at[i, 'duplicate_greater'] is None
-        assert enento.at[i, 'duplicate_lesser'] is None
-        assert isinstance(enento.at[i, 'query_time'], pd.Timestamp)
-        assert 'request_url' not in enento.columns.array
-        assert 'filing' not in enento.columns.array
-        for e_api_id in e_api_ids:
-            assert e_api_id in df['api_id'].array
+        assert enento['duplicate_greater'] is None
+        assert enento['duplicate_lesser'] is None
+        assert isinstance(enento['query_time'], pd.Timestamp)
+        assert not {'request_url', 'filing'} & set(df.columns)
+        assert e_api_ids <= set(df['api_id'])
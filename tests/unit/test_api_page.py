@@ -14,6 +14,38 @@ import responses
 import xbrl_filings_api as xf
 from xbrl_filings_api.api_page import APIPage, IncludedResource
 
+RSPS_WITH_INT_INCLUDED_ID = {
+    'data': [{
+        'type': 'filing',
+        'attributes': {
+            'fxo_id': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0',
+            'package_url': (
+                '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
+                '/asml-2022-12-31-en.zip')
+            },
+        'relationships': {
+            'entity': {
+                'links': {'related': '/api/entities/724500Y6DUVHQD6OXN27'},
+                'data': {'type': 'entity', 'id': 123456789}
+                }
+            },
+        'id': '123',
+        'links': {'self': '/api/filings/123'}
+        }],
+    'included': [{
+        'type': 'entity',
+        'id': 123456789,
+        'attributes': {},
+        'relationships': {},
+        'links': {'self': '/api/entities/123456789'}
+    }],
+    'links': {
+        'self': 'https://filings.xbrl.org/api/filings'
+        },
+    'meta': {'count': 0},
+    'jsonapi': {'version': '1.0'}
+    }
+
 
 @pytest.fixture
 def paging_swedish_size2_pg3_2nd_filingspage(
@@ -197,42 +229,11 @@ def test_main_resource_api_id_as_int():
 
 def test_included_resource_api_id_as_int():
     """Test included resource api_id from API as int."""
-    rsps_with_int_included_id = {
-        'data': [{
-            'type': 'filing',
-            'attributes': {
-                'fxo_id': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0',
-                'package_url': (
-                    '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
-                    '/asml-2022-12-31-en.zip')
-                },
-            'relationships': {
-                'entity': {
-                    'links': {'related': '/api/entities/724500Y6DUVHQD6OXN27'},
-                    'data': {'type': 'entity', 'id': 123456789}
-                    }
-                },
-            'id': '123',
-            'links': {'self': '/api/filings/123'}
-            }],
-        'included': [{
-            'type': 'entity',
-            'id': 123456789,
-            'attributes': {},
-            'relationships': {},
-            'links': {'self': '/api/entities/123456789'}
-        }],
-        'links': {
-            'self': 'https://filings.xbrl.org/api/filings'
-            },
-        'meta': {'count': 0},
-        'jsonapi': {'version': '1.0'}
-        }
     fpage: xf.FilingsPage
     with responses.RequestsMock() as rsps:
         rsps.get(
-            url=re.compile(r'.+'),
-            json=rsps_with_int_included_id,
+            url='https://filings.xbrl.org/api/filings',
+            json=RSPS_WITH_INT_INCLUDED_ID,
         )
         piter = xf.filing_page_iter()
         fpage = next(piter)
@@ -17,6 +17,7 @@ Tests for operations of superclass `set` are found in module
 # ruff: noqa: Q000
 
 import sqlite3
+from contextlib import closing
 from datetime import date
 
 import pytest
@@ -25,20 +26,6 @@ import responses
 import xbrl_filings_api as xf
 
 
-@pytest.fixture
-def asml22en_filingset(asml22en_response):
-    """FilingSet from mock response ``asml22en``."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    return xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-
-
 @pytest.fixture
 def ageas21_22_filingset(urlmock):
     """FilingSet for mock URL ageas21_22, with entities, 6 filings."""
@@ -113,13 +100,12 @@ def test_to_sqlite(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute("SELECT filing_index FROM Filing")
-    saved_fxo_ids = {row[0] for row in cur.fetchall()}
-    assert saved_fxo_ids == e_fxo_ids
-    assert db_record_count(cur) == 3
-    con.close()
+    with closing(sqlite3.connect(db_path)) as con:
+        cur = con.cursor()
+        cur.execute("SELECT filing_index FROM Filing")
+        saved_fxo_ids = {row[0] for row in cur.fetchall()}
+        assert saved_fxo_ids == e_fxo_ids
+        assert db_record_count(cur) == 3
 
 
 @pytest.mark.sqlite
@@ -145,19 +131,18 @@ def test_to_sqlite_update_same_add_entities(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file()
-    con_a = sqlite3.connect(db_path)
-    cur_a = con_a.cursor()
-    assert db_record_count(cur_a) == 3
-    with pytest.raises(sqlite3.OperationalError, match=r'no such column'):
-        cur_a.execute("SELECT entity_api_id FROM Filing")
-    cur_a.execute("SELECT api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_a.fetchall())
-    before_api_ids = set(next(resultzip))
-    before_filing_indexes = set(next(resultzip))
-    assert before_filing_indexes == e_fxo_ids
-    with pytest.raises(sqlite3.OperationalError, match=r'no such table'):
-        cur_a.execute("SELECT * FROM Entity")
-    con_a.close()
+    with closing(sqlite3.connect(db_path)) as con_a:
+        cur_a = con_a.cursor()
+        assert db_record_count(cur_a) == 3
+        with pytest.raises(sqlite3.OperationalError, match=r'no such column'):
+            cur_a.execute("SELECT entity_api_id FROM Filing")
+        cur_a.execute("SELECT api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_a.fetchall())
+        before_api_ids = set(next(resultzip))
+        before_filing_indexes = set(next(resultzip))
+        assert before_filing_indexes == e_fxo_ids
+        with pytest.raises(sqlite3.OperationalError, match=r'no such table'):
+            cur_a.execute("SELECT * FROM Entity")
 
     fs_b: xf.FilingSet = get_oldest3_fi_entities_filingset()
     fs_b.to_sqlite(
@@ -166,22 +151,22 @@ def test_to_sqlite_update_same_add_entities(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file(), "Update won't delete database file"
-    con_b = sqlite3.connect(db_path)
-    cur_b = con_b.cursor()
-    assert db_record_count(cur_b) == 3
-    cur_b.execute("SELECT api_id, entity_api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_b.fetchall())
-    after_api_ids = set(next(resultzip))
-    after_filing_entity_api_ids = set(next(resultzip))
-    after_filing_indexes = set(next(resultzip))
-    assert None not in after_filing_entity_api_ids, 'Entity foreign keys added'
-    assert after_filing_indexes == e_fxo_ids
-    cur_b.execute("SELECT api_id FROM Entity")
-    after_entity_api_ids = set(*zip(*cur_b.fetchall()))
-    assert None not in after_entity_api_ids, 'Entities added'
-    assert after_filing_entity_api_ids == after_entity_api_ids, (
-        'Foreign keys match primary keys on Entity')
-    con_b.close()
+    with closing(sqlite3.connect(db_path)) as con_b:
+        cur_b = con_b.cursor()
+        assert db_record_count(cur_b) == 3
+        cur_b.execute("SELECT api_id, entity_api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_b.fetchall())
+        after_api_ids = set(next(resultzip))
+        after_filing_entity_api_ids = set(next(resultzip))
+        after_filing_indexes = set(next(resultzip))
+        assert None not in after_filing_entity_api_ids, (
+            'Entity foreign keys added')
+        assert after_filing_indexes == e_fxo_ids
+        cur_b.execute("SELECT api_id FROM Entity")
+        after_entity_api_ids = set(*zip(*cur_b.fetchall()))
+        assert None not in after_entity_api_ids, 'Entities added'
+        assert after_filing_entity_api_ids == after_entity_api_ids, (
+            'Foreign keys match primary keys on Entity')
     assert before_api_ids == after_api_ids
 
 
@@ -208,17 +193,16 @@ def test_to_sqlite_update_same_add_vmessages(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file()
-    con_a = sqlite3.connect(db_path)
-    cur_a = con_a.cursor()
-    assert db_record_count(cur_a) == 3
-    cur_a.execute("SELECT api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_a.fetchall())
-    before_api_ids = set(next(resultzip))
-    before_filing_indexes = set(next(resultzip))
-    assert before_filing_indexes == e_fxo_ids
-    with pytest.raises(sqlite3.OperationalError, match=r'no such table'):
-        cur_a.execute("SELECT * FROM ValidationMessage")
-    con_a.close()
+    with closing(sqlite3.connect(db_path)) as con_a:
+        cur_a = con_a.cursor()
+        assert db_record_count(cur_a) == 3
+        cur_a.execute("SELECT api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_a.fetchall())
+        before_api_ids = set(next(resultzip))
+        before_filing_indexes = set(next(resultzip))
+        assert before_filing_indexes == e_fxo_ids
+        with pytest.raises(sqlite3.OperationalError, match=r'no such table'):
+            cur_a.execute("SELECT * FROM ValidationMessage")
 
     fs_b: xf.FilingSet = get_oldest3_fi_vmessages_filingset()
     fs_b.to_sqlite(
@@ -227,22 +211,21 @@ def test_to_sqlite_update_same_add_vmessages(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file(), "Update won't delete database file"
-    con_b = sqlite3.connect(db_path)
-    cur_b = con_b.cursor()
-    assert db_record_count(cur_b) == 3
-    cur_b.execute("SELECT api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_b.fetchall())
-    after_api_ids = set(next(resultzip))
-    after_filing_indexes = set(next(resultzip))
-    assert after_filing_indexes == e_fxo_ids
-    cur_b.execute("SELECT api_id, filing_api_id FROM ValidationMessage")
-    resultzip = zip(*cur_b.fetchall())
-    after_vmessage_api_ids = set(next(resultzip))
-    after_vmessage_filing_api_ids = set(next(resultzip))
-    assert None not in after_vmessage_api_ids, 'Validation messages added'
-    assert after_vmessage_filing_api_ids == after_api_ids, (
-        'Foreign keys match primary keys on ValidationMessage')
-    con_b.close()
+    with closing(sqlite3.connect(db_path)) as con_b:
+        cur_b = con_b.cursor()
+        assert db_record_count(cur_b) == 3
+        cur_b.execute("SELECT api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_b.fetchall())
+        after_api_ids = set(next(resultzip))
+        after_filing_indexes = set(next(resultzip))
+        assert after_filing_indexes == e_fxo_ids
+        cur_b.execute("SELECT api_id, filing_api_id FROM ValidationMessage")
+        resultzip = zip(*cur_b.fetchall())
+        after_vmessage_api_ids = set(next(resultzip))
+        after_vmessage_filing_api_ids = set(next(resultzip))
+        assert None not in after_vmessage_api_ids, 'Validation messages added'
+        assert after_vmessage_filing_api_ids == after_api_ids, (
+            'Foreign keys match primary keys on ValidationMessage')
     assert before_api_ids == after_api_ids
 
 
@@ -267,15 +250,14 @@ def test_to_sqlite_update_more(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file()
-    con_a = sqlite3.connect(db_path)
-    cur_a = con_a.cursor()
-    assert db_record_count(cur_a) == 3
-    cur_a.execute("SELECT api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_a.fetchall())
-    before_api_ids = set(next(resultzip))
-    before_filing_indexes = set(next(resultzip))
-    assert before_filing_indexes == e_before_fxo_ids
-    con_a.close()
+    with closing(sqlite3.connect(db_path)) as con_a:
+        cur_a = con_a.cursor()
+        assert db_record_count(cur_a) == 3
+        cur_a.execute("SELECT api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_a.fetchall())
+        before_api_ids = set(next(resultzip))
+        before_filing_indexes = set(next(resultzip))
+        assert before_filing_indexes == e_before_fxo_ids
 
     fs_b: xf.FilingSet = asml22en_filingset
     fs_b.to_sqlite(
@@ -284,15 +266,14 @@ def test_to_sqlite_update_more(
         flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
         )
     assert db_path.is_file(), "Update won't delete database file"
-    con_b = sqlite3.connect(db_path)
-    cur_b = con_b.cursor()
-    assert db_record_count(cur_b) == 4
-    cur_b.execute("SELECT api_id, filing_index FROM Filing")
-    resultzip = zip(*cur_b.fetchall())
-    after_api_ids = set(next(resultzip))
-    after_filing_indexes = set(next(resultzip))
-    assert after_filing_indexes == {*e_before_fxo_ids, e_added_fxo_id}
-    con_b.close()
+    with closing(sqlite3.connect(db_path)) as con_b:
+        cur_b = con_b.cursor()
+        assert db_record_count(cur_b) == 4
+        cur_b.execute("SELECT api_id, filing_index FROM Filing")
+        resultzip = zip(*cur_b.fetchall())
+        after_api_ids = set(next(resultzip))
+        after_filing_indexes = set(next(resultzip))
+        assert after_filing_indexes == {*e_before_fxo_ids, e_added_fxo_id}
     for retained_api_id in before_api_ids:
         assert retained_api_id in after_api_ids
 
@@ -11,6 +11,64 @@ import responses
 
 import xbrl_filings_api as xf
 
+OLDEST3_FI_REPR_PREFIX = "FilingsPage(request_url='"
+OLDEST3_FI_REPR_QUERY_TIME = "', query_time=datetime("
+OLDEST3_FI_REPR_SUFFIX = (
+    '), len(filing_list)=3, len(entity_list)=3, '
+    'len(validation_message_list)=45)'
+    )
+
+RSPS_WITH_INT_INCLUDED_ID = {
+    'data': [{
+        'type': 'filing',
+        'attributes': {
+            'fxo_id': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0',
+            'package_url': (
+                '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
+                '/asml-2022-12-31-en.zip'
+                )
+            },
+        'relationships': {
+            'entity': {
+                'links': {'related': '/api/entities/724500Y6DUVHQD6OXN27'},
+                'data': {'type': 'entity', 'id': 123456789}
+                },
+            'validation_messages': {
+                'links': {
+                    'related': '/api/filings/123/validation_messages'},
+                'data': [
+                    {'type': 'validation_message', 'id': 987654}
+                    ]
+                },
+            },
+        'id': '123',
+        'links': {'self': '/api/filings/123'}
+        }],
+    'included': [
+        {
+            'type': 'entity',
+            'id': 123456789,
+            'attributes': {},
+            'relationships': {},
+            'links': {'self': '/api/entities/123456789'}
+        },
+        {
+            'type': 'validation_message',
+            'attributes': {
+                'code': 'xbrl.5.2.5.2:calcInconsistency',
+                'message': 'Calculation inconsistent',
+                'severity': 'INCONSISTENCY'
+                },
+            'id': 987654
+        },
+        ],
+    'links': {
+        'self': 'https://filings.xbrl.org/api/filings'
+        },
+    'meta': {'count': 0},
+    'jsonapi': {'version': '1.0'}
+    }
+
 
 @pytest.fixture
 def oldest3_fi_ent_vmessages_filingspage(oldest3_fi_ent_vmessages_response):
@@ -33,32 +91,21 @@ def test_attributes(oldest3_fi_ent_vmessages_filingspage):
     fpage: xf.FilingsPage = oldest3_fi_ent_vmessages_filingspage
     assert fpage.query_filing_count > 10
     assert len(fpage.filing_list) == 3
-    for filing in fpage.filing_list:
-        assert isinstance(filing, xf.Filing)
+    assert {type(filing) for filing in fpage.filing_list} == {xf.Filing}
     assert len(fpage.entity_list) == 3
-    for ent in fpage.entity_list:
-        assert isinstance(ent, xf.Entity)
+    assert {type(ent) for ent in fpage.entity_list} == {xf.Entity}
     assert len(fpage.validation_message_list) > 3
-    for vmsg in fpage.validation_message_list:
-        assert isinstance(vmsg, xf.ValidationMessage)
+    assert {type(vmsg) for vmsg in fpage.validation_message_list} == {
+        xf.ValidationMessage}
 
 
 def test_repr(oldest3_fi_ent_vmessages_filingspage):
     """Test `__repr__` of `FilingsPage`."""
-    e_repr1 = (
-        "FilingsPage(request_url='")
-    e_repr2 = (
-        "', query_time=datetime("
-        )
-    e_repr3 = (
-        '), len(filing_list)=3, len(entity_list)=3, '
-        'len(validation_message_list)=45)'
-        )
     fpage: xf.FilingsPage = oldest3_fi_ent_vmessages_filingspage
     fpage_repr = repr(fpage)
-    assert fpage_repr.startswith(e_repr1)
-    assert e_repr2 in fpage_repr
-    assert fpage_repr.endswith(e_repr3)
+    assert fpage_repr.startswith(OLDEST3_FI_REPR_PREFIX)
+    assert OLDEST3_FI_REPR_QUERY_TIME in fpage_repr
+    assert fpage_repr.endswith(OLDEST3_FI_REPR_SUFFIX)
 
 
 def test_included_resource_api_id_as_int():
@@ -66,67 +113,15 @@ def test_included_resource_api_id_as_int():
     Test included resource api_id from API as int resolved to final
     objects.
     """
-    rsps_with_int_included_id = {
-        'data': [{
-            'type': 'filing',
-            'attributes': {
-                'fxo_id': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0',
-                'package_url': (
-                    '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
-                    '/asml-2022-12-31-en.zip'
-                    )
-                },
-            'relationships': {
-                'entity': {
-                    'links': {'related': '/api/entities/724500Y6DUVHQD6OXN27'},
-                    'data': {'type': 'entity', 'id': 123456789}
-                    },
-                'validation_messages': {
-                    'links': {
-                        'related': '/api/filings/123/validation_messages'},
-                    'data': [
-                        {'type': 'validation_message', 'id': 987654}
-                        ]
-                    },
-                },
-            'id': '123',
-            'links': {'self': '/api/filings/123'}
-            }],
-        'included': [
-            {
-                'type': 'entity',
-                'id': 123456789,
-                'attributes': {},
-                'relationships': {},
-                'links': {'self': '/api/entities/123456789'}
-            },
-            {
-                'type': 'validation_message',
-                'attributes': {
-                    'code': 'xbrl.5.2.5.2:calcInconsistency',
-                    'message': 'Calculation inconsistent',
-                    'severity': 'INCONSISTENCY'
-                    },
-                'id': 987654
-            },
-            ],
-        'links': {
-            'self': 'https://filings.xbrl.org/api/filings'
-            },
-        'meta': {'count': 0},
-        'jsonapi': {'version': '1.0'}
-        }
     fs: xf.FilingSet
     with responses.RequestsMock() as rsps:
         rsps.get(
-            url=re.compile(r'.+'),
-            json=rsps_with_int_included_id,
+            url='https://filings.xbrl.org/api/filings',
+            json=RSPS_WITH_INT_INCLUDED_ID,
         )
         fs = xf.get_filings(flags=xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
-    assert len(fs) == 1
-    filing = next(iter(fs))
-    assert len(filing.validation_messages) == 1
-    vmsg = next(iter(filing.validation_messages))
+    [filing] = fs
+    [vmsg] = filing.validation_messages
     assert isinstance(vmsg, xf.ValidationMessage)
     assert vmsg.api_id == '987654'
     ent = filing.entity
@@ -115,9 +115,8 @@ def test_all_public_classes_have_repr():
     Test that all concrete root module classes have custom __repr__.
     """
     pclasses = [
-        getattr(xf, name)
-        for name in dir(xf)
-        if inspect.isclass(getattr(xf, name))
+        obj for name, obj in vars(xf).items()
+        if inspect.isclass(obj) and not name.startswith('_')
         ]
     for pclass in pclasses:
         if (issubclass(pclass, Exception)
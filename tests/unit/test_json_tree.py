@@ -11,8 +11,11 @@ with the exception of init attribute `do_not_track`.
 # SPDX-License-Identifier: MIT
 
 import copy
+import functools
+import json
 import logging
 from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
@@ -22,63 +25,14 @@ from xbrl_filings_api.parse_type import ParseType
 
 UTC = timezone.utc
 
-ASML22EN_ENT_VMSG_FILING_FRAG = {
-    'type': 'filing',
-    'attributes': {
-        'date_added': '2023-02-16 14:33:58.236220',
-        'country': 'NL',
-        'sha256': (
-            '3f44981c656dc2bcd0ed3a88e6d062e6'
-            'b8c041a656f420257bccd63535c2b6ac'
-            ),
-        'report_url': (
-            '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0/asml-2022-12-31-en'
-            '/reports/asml-2022-12-31-en.xhtml'
-            ),
-        'fxo_id': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0',
-        'error_count': 0,
-        'inconsistency_count': 4,
-        'viewer_url': (
-            '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0/asml-2022-12-31-en'
-            '/reports/ixbrlviewer.html'
-            ),
-        'json_url': (
-            '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
-            '/asml-2022-12-31-en.json'
-            ),
-        'processed': '2023-04-19 10:20:23.668110',
-        'warning_count': 7,
-        'period_end': '2022-12-31',
-        'package_url': (
-            '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0'
-            '/asml-2022-12-31-en.zip'
-            )
-        },
-    'relationships': {
-        'validation_messages': {
-            'links': {'related': '/api/filings/4261/validation_messages'},
-            'data': [
-            {'type': 'validation_message', 'id': '66611'},
-            {'type': 'validation_message', 'id': '66612'},
-            {'type': 'validation_message', 'id': '66613'},
-            {'type': 'validation_message', 'id': '66614'},
-            {'type': 'validation_message', 'id': '66615'},
-            {'type': 'validation_message', 'id': '66616'},
-            {'type': 'validation_message', 'id': '66617'},
-            {'type': 'validation_message', 'id': '66618'},
-            {'type': 'validation_message', 'id': '66619'},
-            {'type': 'validation_message', 'id': '66620'},
-            {'type': 'validation_message', 'id': '66621'}
-            ]
-            },
-        'entity': {
-            'links': {'related': '/api/entities/724500Y6DUVHQD6OXN27'},
-            'data': {'type': 'entity', 'id': '1969'}
-            }
-        },
-    'id': '4261',
-    'links': {'self': '/api/filings/4261'}
-    }
+FILING_FRAG_PATH = (
+    Path(__file__).parent / 'asml22en_ent_vmsg_filing_frag.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _asml22en_ent_vmsg_filing_frag():
+    """Filing JSON fragment of mock response ``asml22en_ent_vmsg``."""
+    return json.loads(FILING_FRAG_PATH.read_bytes())
 
 
 @pytest.fixture(scope='module')
@@ -91,35 +45,44 @@ def asml22en_ent_vmsg_request_url():
         )
 
 
-@pytest.fixture
-def _reset_jsontree_state(monkeypatch):
-    """Reset the state of the JSONTree type object."""
-    monkeypatch.setattr(JSONTree, '_unaccessed_paths', {})
-    monkeypatch.setattr(JSONTree, '_object_path_counter', {})
-    monkeypatch.setattr(JSONTree, 'unexpected_resource_types', set())
+@pytest.fixture(autouse=True)
+def _reset_jsontree_state():
+    """Reset the state of the JSONTree type object for each test."""
+    saved_state = (
+        JSONTree._unaccessed_paths,
+        JSONTree._object_path_counter,
+        JSONTree.unexpected_resource_types
+        )
+    JSONTree._unaccessed_paths = {}
+    JSONTree._object_path_counter = {}
+    JSONTree.unexpected_resource_types = set()
+    yield
+    (
+        JSONTree._unaccessed_paths,
+        JSONTree._object_path_counter,
+        JSONTree.unexpected_resource_types
+        ) = saved_state
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_init(asml22en_ent_vmsg_request_url):
     """Test init function."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
     assert jtree.class_name == 'Filing'
-    assert jtree.tree == ASML22EN_ENT_VMSG_FILING_FRAG
+    assert jtree.tree == _asml22en_ent_vmsg_filing_frag()
     assert jtree.do_not_track is False
     assert JSONTree.unexpected_resource_types == set()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_close_prematurely(asml22en_ent_vmsg_request_url):
     """Test making a get call after tree has been closed."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -130,12 +93,11 @@ def test_close_prematurely(asml22en_ent_vmsg_request_url):
         jtree.get(key_path='attributes.country', parse_type=None)
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_close_twice(asml22en_ent_vmsg_request_url):
     """Test closing the JSONTree twice."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -147,12 +109,11 @@ def test_close_twice(asml22en_ent_vmsg_request_url):
 
 
 @pytest.mark.date
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_date_value(asml22en_ent_vmsg_request_url):
     """Test reading a date value from the tree."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -165,11 +126,10 @@ def test_get_date_value(asml22en_ent_vmsg_request_url):
 
 
 @pytest.mark.date
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_date_value_bad_date(asml22en_ent_vmsg_request_url, caplog):
     """Test reading a bad date value from the tree."""
     caplog.set_level(logging.WARNING)
-    filing_frag = copy.deepcopy(ASML22EN_ENT_VMSG_FILING_FRAG)
+    filing_frag = copy.deepcopy(_asml22en_ent_vmsg_filing_frag())
     filing_frag['attributes']['period_end'] = '2022-99-99'
     e_log = (
         "Could not parse ISO date string '2022-99-99' for Filing object JSON "
@@ -190,32 +150,37 @@ def test_get_date_value_bad_date(asml22en_ent_vmsg_request_url, caplog):
     jtree.close()
 
 
-@pytest.mark.date
-@pytest.mark.usefixtures('_reset_jsontree_state')
-def test_get_date_value_unparsed(asml22en_ent_vmsg_request_url):
-    """Test reading a date value from the tree unparsed."""
+@pytest.mark.parametrize(('key_path', 'expected'), [
+    pytest.param(
+        'attributes.period_end', '2022-12-31', marks=pytest.mark.date),
+    pytest.param(
+        'attributes.processed', '2023-04-19 10:20:23.668110',
+        marks=pytest.mark.datetime),
+    ('attributes.viewer_url', (
+        '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0/asml-2022-12-31-en'
+        '/reports/ixbrlviewer.html'
+        )),
+    ])
+def test_get_value_unparsed(asml22en_ent_vmsg_request_url, key_path, expected):
+    """Test reading date, datetime and URL values unparsed."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
-    last_end_date = jtree.get(
-        key_path='attributes.period_end',
-        parse_type=None
-        )
-    assert last_end_date == '2022-12-31'
+    value = jtree.get(key_path=key_path, parse_type=None)
+    assert value == expected
     jtree.close()
 
 
 @pytest.mark.datetime
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_datetime_value(asml22en_ent_vmsg_request_url):
     """Test reading a datetime value from the tree."""
     e_datetime = datetime(2023, 4, 19, 10, 20, 23, 668110, tzinfo=UTC)
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -229,12 +194,11 @@ def test_get_datetime_value(asml22en_ent_vmsg_request_url):
 
 
 @pytest.mark.datetime
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_datetime_value_bad_datetime(
         asml22en_ent_vmsg_request_url, caplog):
     """Test reading a bad datetime value from the tree."""
     caplog.set_level(logging.WARNING)
-    filing_frag = copy.deepcopy(ASML22EN_ENT_VMSG_FILING_FRAG)
+    filing_frag = copy.deepcopy(_asml22en_ent_vmsg_filing_frag())
     filing_frag['attributes']['processed'] = '2023-99-99 99:99:99.999999'
     e_log = (
         "Could not parse ISO datetime string '2023-99-99 99:99:99.999999' for "
@@ -256,11 +220,10 @@ def test_get_datetime_value_bad_datetime(
 
 
 @pytest.mark.datetime
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_datetime_timezone0200_value(asml22en_ent_vmsg_request_url):
     """Test reading a timezoned (0200) datetime value from the tree."""
     e_datetime = datetime(2023, 4, 19, 8, 20, 23, 668110, tzinfo=UTC)
-    filing_frag = copy.deepcopy(ASML22EN_ENT_VMSG_FILING_FRAG)
+    filing_frag = copy.deepcopy(_asml22en_ent_vmsg_filing_frag())
     filing_frag['attributes']['processed'] = '2023-04-19 10:20:23.668110+0200'
     jtree = JSONTree(
         class_name='Filing',
@@ -278,25 +241,6 @@ def test_get_datetime_timezone0200_value(asml22en_ent_vmsg_request_url):
     jtree.close()
 
 
-@pytest.mark.datetime
-@pytest.mark.usefixtures('_reset_jsontree_state')
-def test_get_datetime_value_unparsed(asml22en_ent_vmsg_request_url):
-    """Test reading a datetime value from the tree unparsed."""
-    jtree = JSONTree(
-        class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
-        request_url=asml22en_ent_vmsg_request_url,
-        do_not_track=False
-        )
-    processed_time = jtree.get(
-        key_path='attributes.processed',
-        parse_type=None
-        )
-    assert processed_time == '2023-04-19 10:20:23.668110'
-    jtree.close()
-
-
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_url_value(asml22en_ent_vmsg_request_url, monkeypatch):
     """Test reading a URL value from the tree."""
     monkeypatch.setattr(
@@ -307,7 +251,7 @@ def test_get_url_value(asml22en_ent_vmsg_request_url, monkeypatch):
         )
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -319,14 +263,13 @@ def test_get_url_value(asml22en_ent_vmsg_request_url, monkeypatch):
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_url_value_bad_url(
         asml22en_ent_vmsg_request_url, monkeypatch, caplog):
     """Test reading a bad URL value from the tree."""
     monkeypatch.setattr(
         options, 'entry_point_url', 'https://filings.xbrl.org/api')
     caplog.set_level(logging.WARNING)
-    filing_frag = copy.deepcopy(ASML22EN_ENT_VMSG_FILING_FRAG)
+    filing_frag = copy.deepcopy(_asml22en_ent_vmsg_filing_frag())
     filing_frag['attributes']['viewer_url'] = 'http://[1:2:3:4:5:6/'
     e_log = (
         "Could not determine absolute URL string from 'http://[1:2:3:4:5:6/' "
@@ -348,33 +291,11 @@ def test_get_url_value_bad_url(
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
-def test_get_url_value_unparsed(asml22en_ent_vmsg_request_url):
-    """Test reading a URL value from the tree unparsed."""
-    e_url = (
-        '/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0/asml-2022-12-31-en/reports'
-        '/ixbrlviewer.html'
-        )
-    jtree = JSONTree(
-        class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
-        request_url=asml22en_ent_vmsg_request_url,
-        do_not_track=False
-        )
-    viewer_url = jtree.get(
-        key_path='attributes.viewer_url',
-        parse_type=None
-        )
-    assert viewer_url == e_url
-    jtree.close()
-
-
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_int_value(asml22en_ent_vmsg_request_url):
     """Test reading an int value from the tree."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -386,12 +307,11 @@ def test_get_int_value(asml22en_ent_vmsg_request_url):
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_int_value_as_url_noop(asml22en_ent_vmsg_request_url):
     """Test reading an int value as an URL (no-op) from the tree."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -403,12 +323,11 @@ def test_get_int_value_as_url_noop(asml22en_ent_vmsg_request_url):
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_dict_value(asml22en_ent_vmsg_request_url):
     """Test reading a subdict value from the tree."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -418,7 +337,6 @@ def test_get_dict_value(asml22en_ent_vmsg_request_url):
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_get_dict_value_parse_datetime_noop(asml22en_ent_vmsg_request_url):
     """
     Test reading a subdict value from the tree, parse_type=DATETIME
@@ -426,7 +344,7 @@ def test_get_dict_value_parse_datetime_noop(asml22en_ent_vmsg_request_url):
     """
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -439,12 +357,11 @@ def test_get_dict_value_parse_datetime_noop(asml22en_ent_vmsg_request_url):
     jtree.close()
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_do_not_track_false(asml22en_ent_vmsg_request_url):
     """Test do_not_track=False reading."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=False
         )
@@ -462,16 +379,16 @@ def test_do_not_track_false(asml22en_ent_vmsg_request_url):
     assert rcount.success_count == 1
     assert rcount.total_count == 1
     uakpaths = JSONTree.get_unaccessed_key_paths()
-    assert 'attributes.country' not in uakpaths
+    assert ('Filing', 'attributes.country') not in uakpaths
+    assert ('Filing', 'attributes.processed') in uakpaths
     assert len(uakpaths) == 20
 
 
-@pytest.mark.usefixtures('_reset_jsontree_state')
 def test_raises_do_not_track_true(asml22en_ent_vmsg_request_url):
     """Test do_not_track=True reading."""
     jtree = JSONTree(
         class_name='Filing',
-        json_frag=ASML22EN_ENT_VMSG_FILING_FRAG,
+        json_frag=_asml22en_ent_vmsg_filing_frag(),
         request_url=asml22en_ent_vmsg_request_url,
         do_not_track=True
         )
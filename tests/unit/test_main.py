@@ -8,11 +8,13 @@ import re
 
 from xbrl_filings_api.__about__ import __version__
 
+_OUT_RE = re.compile(rf'\n[a-z_]+ version {re.escape(__version__)}\n')
+
 
 def test_main_print(capfd):
     """Test __main__ script."""
     # Import prints to stdout
     import xbrl_filings_api.__main__  # noqa: F401
     out, err = capfd.readouterr()
-    assert re.fullmatch(f'\\n[a-z_]+ version {__version__}\n', out)
+    assert _OUT_RE.fullmatch(out)
     assert err == ''
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: MIT
 
 import sqlite3
+from contextlib import closing
 
 import pytest
 import responses
@@ -12,6 +13,8 @@ import responses
 import xbrl_filings_api as xf
 from xbrl_filings_api.default_views import DEFAULT_VIEWS
 
+DEFAULT_VIEW_NAMES = frozenset(dview.name for dview in DEFAULT_VIEWS)
+
 
 @pytest.fixture(scope='module')
 def get_asml22en_entities_filingset(urlmock):
@@ -33,96 +36,82 @@ def get_asml22en_entities_filingset(urlmock):
     return _get_asml22en_entities_filingset
 
 
-@pytest.mark.sqlite
-def test_views_added(
-        get_oldest3_fi_ent_vmessages_filingset, tmp_path, monkeypatch):
-    """Test views are added when `options.views` is set."""
-    monkeypatch.setattr(xf.options, 'views', DEFAULT_VIEWS)
-    fs: xf.FilingSet = get_oldest3_fi_ent_vmessages_filingset()
-    db_path = tmp_path / 'test_views_added.db'
-    fs.to_sqlite(
-        path=db_path,
-        update=False,
-        flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
+def _view_names(db_path):
+    """Get names of views in database file `db_path` (read-only)."""
+    uri = f'{db_path.as_uri()}?mode=ro'
+    with closing(sqlite3.connect(uri, uri=True)) as con:
+        return frozenset(
+            name for (name,) in con.execute(
+                'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
+            )
+
+
+def _export_views_db(tmp_path_factory, fs, views, flags):
+    """Export `fs` with `options.views` set as `views`, return path."""
+    db_path = tmp_path_factory.mktemp('views') / 'views.db'
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(xf.options, 'views', views)
+        fs.to_sqlite(path=db_path, update=False, flags=flags)
+    return db_path
+
+
+@pytest.fixture(scope='module')
+def views_added_db(oldest3_fi_ent_vmessages_filingset, tmp_path_factory):
+    """Database of ``oldest3_fi_ent_vmessages`` with default views."""
+    return _export_views_db(
+        tmp_path_factory, oldest3_fi_ent_vmessages_filingset,
+        DEFAULT_VIEWS, xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
         )
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
-    existing_views = set(*zip(*cur.fetchall()))
-    con.close()
-    for dview in DEFAULT_VIEWS:
-        assert dview.name in existing_views
 
 
-@pytest.mark.sqlite
-def test_views_not_added(
-        get_oldest3_fi_ent_vmessages_filingset, tmp_path, monkeypatch):
-    """Test views are not added when `options.views` is None."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    fs: xf.FilingSet = get_oldest3_fi_ent_vmessages_filingset()
-    db_path = tmp_path / 'test_views_not_added.db'
-    fs.to_sqlite(
-        path=db_path,
-        update=False,
-        flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
+@pytest.fixture(scope='module')
+def views_not_added_db(oldest3_fi_ent_vmessages_filingset, tmp_path_factory):
+    """Database of ``oldest3_fi_ent_vmessages`` without views."""
+    return _export_views_db(
+        tmp_path_factory, oldest3_fi_ent_vmessages_filingset,
+        None, xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
         )
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
-    existing_views = set(*zip(*cur.fetchall()))
-    con.close()
-    assert existing_views == set()
 
 
-@pytest.mark.sqlite
-def test_require_entities_added(
-        get_oldest3_fi_entities_filingset, tmp_path, monkeypatch):
-    """Test view which requires entities is added properly."""
-    monkeypatch.setattr(xf.options, 'views', DEFAULT_VIEWS)
-    fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
-    db_path = tmp_path / 'test_require_entities_added.db'
-    fs.to_sqlite(
-        path=db_path,
-        update=False,
-        flags=xf.GET_ENTITY
+@pytest.fixture(scope='module')
+def views_require_entities_db(
+        oldest3_fi_entities_filingset, tmp_path_factory):
+    """Database of ``oldest3_fi_entities`` with default views."""
+    return _export_views_db(
+        tmp_path_factory, oldest3_fi_entities_filingset,
+        DEFAULT_VIEWS, xf.GET_ENTITY
         )
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
-    existing_views = set(*zip(*cur.fetchall()))
-    con.close()
-    assert 'ViewEnclosure' in existing_views
 
 
-@pytest.mark.sqlite
-def test_require_entities_not_added(
-        get_oldest3_fi_filingset, tmp_path, monkeypatch):
-    """
-    Test view which requires entities is not added when no entities.
-    """
-    monkeypatch.setattr(xf.options, 'views', DEFAULT_VIEWS)
-    fs: xf.FilingSet = get_oldest3_fi_filingset()
-    db_path = tmp_path / 'test_require_entities_not_added.db'
-    fs.to_sqlite(
-        path=db_path,
-        update=False,
-        flags=xf.GET_ONLY_FILINGS
+@pytest.fixture(scope='module')
+def views_no_entities_db(oldest3_fi_filingset, tmp_path_factory):
+    """Database of ``oldest3_fi`` (no entities) with default views."""
+    return _export_views_db(
+        tmp_path_factory, oldest3_fi_filingset,
+        DEFAULT_VIEWS, xf.GET_ONLY_FILINGS
         )
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
-    existing_views = set(*zip(*cur.fetchall()))
-    con.close()
-    assert 'ViewEnclosure' not in existing_views
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(('db_fixture', 'e_views'), [
+    pytest.param('views_added_db', DEFAULT_VIEW_NAMES, id='views_added'),
+    pytest.param('views_not_added_db', frozenset(), id='views_not_added'),
+    pytest.param(
+        'views_require_entities_db', {'ViewEnclosure', 'ViewFilingAge'},
+        id='require_entities_added'),
+    pytest.param(
+        'views_no_entities_db', frozenset(),
+        id='require_entities_not_added'),
+    ])
+def test_views_in_database(request, db_fixture, e_views):
+    """Test views are added according to `options.views` and tables."""
+    existing_views = _view_names(request.getfixturevalue(db_fixture))
+    assert existing_views == e_views
 
 
 @pytest.mark.sqlite
 def test_add_with_same_name(
-        get_oldest3_fi_ent_vmessages_filingset, tmp_path, monkeypatch):
+        oldest3_fi_ent_vmessages_filingset, tmp_path, monkeypatch):
     """Test with two views named ``ViewTest``."""
     sql = 'SELECT * FROM Filing'
     overlapping_list = [
@@ -130,7 +119,7 @@ def test_add_with_same_name(
         xf.SQLiteView(name='ViewTest', required_tables=(), sql=sql),
         ]
     monkeypatch.setattr(xf.options, 'views', overlapping_list)
-    fs: xf.FilingSet = get_oldest3_fi_ent_vmessages_filingset()
+    fs: xf.FilingSet = oldest3_fi_ent_vmessages_filingset
     db_path = tmp_path / 'test_add_with_same_name.db'
     with pytest.raises(
             ValueError,
@@ -145,14 +134,14 @@ def test_add_with_same_name(
 
 @pytest.mark.sqlite
 def test_views_retained_after_update(
-        get_oldest3_fi_ent_vmessages_filingset,
+        oldest3_fi_ent_vmessages_filingset,
         get_asml22en_entities_filingset, tmp_path, monkeypatch):
     """Test views are retained after update to the database."""
     monkeypatch.setattr(xf.options, 'views', DEFAULT_VIEWS)
     db_path = tmp_path / 'test_views_retained_after_update.db'
     flags = xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
 
-    fs_a: xf.FilingSet = get_oldest3_fi_ent_vmessages_filingset()
+    fs_a: xf.FilingSet = oldest3_fi_ent_vmessages_filingset
     fs_a.to_sqlite(
         path=db_path,
         update=False,
@@ -165,11 +154,6 @@ def test_views_retained_after_update(
         flags=flags
         )
 
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        'SELECT name FROM sqlite_schema WHERE type = ?', ('view',))
-    existing_views = set(*zip(*cur.fetchall()))
-    con.close()
+    existing_views = _view_names(db_path)
     for dview in DEFAULT_VIEWS:
         assert dview.name in existing_views
@@ -19,16 +19,31 @@ import pytest
 
 import xbrl_filings_api as xf
 
+OLDEST3_FI_VMSG_API_IDS = frozenset({
+    '5464', '5465', '5466', '5467', '5468', '5469', '5470', '5471', '5472',
+    '5473', '5474', '5475', '5476', '5477', '5478', '8662', '8663', '8664',
+    '8665', '8666', '8667', '8668', '8669', '8670', '8671', '8672', '8673',
+    '8674', '8675', '8676', '8677', '8678', '8679', '8680', '16748', '16749',
+    '16750', '16751', '16752', '16753', '16754', '16755', '16756', '16757',
+    '16758'
+    })
+
+
+def _row(pd_data, api_id):
+    """Get row of `pd_data` with column ``api_id`` value `api_id`."""
+    i = pd_data['api_id'].index(api_id)
+    return {col: values[i] for col, values in pd_data.items()}
+
 
 class TestFilingSet_get_pandas_data:
     """Test method FilingSet.get_pandas_data, unit testing."""
 
-    def test_defaults(self, get_oldest3_fi_filingset):
+    def test_defaults(self, oldest3_fi_filingset):
         """
         Test default parameter values for FilingSet.get_pandas_data,
         unit testing.
         """
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=False,
@@ -37,36 +52,28 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
-        assert pd_data['country'][i] == 'FI'
-        assert pd_data['filing_index'][i] == (
+        enento20en = _row(pd_data, '710')
+        assert enento20en['country'] == 'FI'
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
-        assert pd_data['language'][i] == 'en'
-        assert pd_data['error_count'][i] == 0
-        assert pd_data['inconsistency_count'][i] == 19
-        assert pd_data['warning_count'][i] == 0
-        assert 'added_time_str' not in pd_data
-        assert 'processed_time_str' not in pd_data
-        assert 'entity_api_id' not in pd_data
-        assert 'json_url' not in pd_data
-        assert 'package_url' not in pd_data
-        assert 'viewer_url' not in pd_data
-        assert 'xhtml_url' not in pd_data
-        assert 'request_url' not in pd_data
-        assert 'json_download_path' not in pd_data
-        assert 'package_download_path' not in pd_data
-        assert 'xhtml_download_path' not in pd_data
-        assert pd_data['package_sha256'][i] == (
+        assert enento20en['language'] == 'en'
+        assert enento20en['error_count'] == 0
+        assert enento20en['inconsistency_count'] == 19
+        assert enento20en['warning_count'] == 0
+        assert not {
+            'added_time_str', 'processed_time_str', 'entity_api_id',
+            'json_url', 'package_url', 'viewer_url', 'xhtml_url',
+            'request_url', 'json_download_path', 'package_download_path',
+            'xhtml_download_path', 'entity', 'validation_messages'
+            } & pd_data.keys()
+        assert enento20en['package_sha256'] == (
             'ab0c60224c225ba3921188514ecd6c37af6a947f68a5c3a0c6eb34abfaae822b')
-        assert 'entity' not in pd_data
-        assert 'validation_messages' not in pd_data
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     @pytest.mark.date
-    def test_attr_names_3cols(self, get_oldest3_fi_filingset):
+    def test_attr_names_3cols(self, oldest3_fi_filingset):
         """Test attr_names defining 3 columns, unit testing."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=['api_id', 'filing_index', 'last_end_date'],
             with_entity=False,
@@ -75,24 +82,23 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
+        enento20en = _row(pd_data, '710')
         assert len(pd_data) == 3
-        assert pd_data['filing_index'][i] == (
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
-        assert pd_data['last_end_date'][i] == (
+        assert enento20en['last_end_date'] == (
             datetime(2020, 12, 31, tzinfo=None))
-        assert pd_data['last_end_date'][i].tzinfo is None
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert enento20en['last_end_date'].tzinfo is None
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     @pytest.mark.date
     def test_attr_names_entity_attr_with_entity_false(
-            self, get_oldest3_fi_entities_filingset):
+            self, oldest3_fi_entities_filingset):
         """
         Test attr_names with entity attribute, still with_entity=False,
         unit testing.
         """
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.get_pandas_data(
             attr_names=[
                 'api_id', 'filing_index', 'last_end_date', 'entity.name'],
@@ -102,20 +108,19 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
+        enento20en = _row(pd_data, '710')
         assert len(pd_data) == 4
-        assert pd_data['filing_index'][i] == (
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
-        assert pd_data['last_end_date'][i] == (
+        assert enento20en['last_end_date'] == (
             datetime(2020, 12, 31, tzinfo=None))
-        assert pd_data['last_end_date'][i].tzinfo is None
-        assert pd_data['entity.name'][i] == 'Enento Group Oyj'
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert enento20en['last_end_date'].tzinfo is None
+        assert enento20en['entity.name'] == 'Enento Group Oyj'
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
-    def test_with_entity_true(self, get_oldest3_fi_entities_filingset):
+    def test_with_entity_true(self, oldest3_fi_entities_filingset):
         """Test with_entity=True, unit testing, unit testing."""
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=True,
@@ -124,25 +129,24 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
-        assert pd_data['filing_index'][i] == (
+        enento20en = _row(pd_data, '710')
+        assert enento20en['filing_index'] == (
             '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0')
         assert 'entity_api_id' not in pd_data
-        assert pd_data['entity.api_id'][i] == '548'
-        assert pd_data['entity.identifier'][i] == '743700EPLUWXE25HGM03'
-        assert pd_data['entity.name'][i] == 'Enento Group Oyj'
+        assert enento20en['entity.api_id'] == '548'
+        assert enento20en['entity.identifier'] == '743700EPLUWXE25HGM03'
+        assert enento20en['entity.name'] == 'Enento Group Oyj'
         assert 'entity.api_entity_filings_url' not in pd_data
-        assert isinstance(pd_data['entity.query_time'][i], datetime)
-        assert 'entity.request_url' not in pd_data
-        assert 'entity.filings' not in pd_data
-        assert 'entity' not in pd_data
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert isinstance(enento20en['entity.query_time'], datetime)
+        assert not {
+            'entity.request_url', 'entity.filings', 'entity'
+            } & pd_data.keys()
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     @pytest.mark.datetime
-    def test_strip_timezone_false(self, get_oldest3_fi_filingset):
+    def test_strip_timezone_false(self, oldest3_fi_filingset):
         """Test strip_timezone=False, unit testing."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=False,
@@ -151,17 +155,16 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
-        assert pd_data['added_time'][i].tzinfo is not None
-        assert pd_data['processed_time'][i].tzinfo is not None
-        assert pd_data['query_time'][i].tzinfo is not None
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        enento20en = _row(pd_data, '710')
+        assert enento20en['added_time'].tzinfo is not None
+        assert enento20en['processed_time'].tzinfo is not None
+        assert enento20en['query_time'].tzinfo is not None
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     @pytest.mark.date
-    def test_date_as_datetime_false(self, get_oldest3_fi_filingset):
+    def test_date_as_datetime_false(self, oldest3_fi_filingset):
         """Test date_as_datetime=False, unit testing."""
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=False,
@@ -170,17 +173,16 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
-        assert type(pd_data['last_end_date'][i]) is date
-        assert type(pd_data['reporting_date'][i]) is date
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        enento20en = _row(pd_data, '710')
+        assert type(enento20en['last_end_date']) is date
+        assert type(enento20en['reporting_date']) is date
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
-    def test_include_urls_true(self, get_oldest3_fi_filingset, monkeypatch):
+    def test_include_urls_true(self, oldest3_fi_filingset, monkeypatch):
         """Test include_urls=True, unit testing."""
         monkeypatch.setattr(
             xf.options, 'entry_point_url', 'https://filings.xbrl.org/api')
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=False,
@@ -189,34 +191,33 @@ class TestFilingSet_get_pandas_data:
             include_urls=True,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
-        assert pd_data['json_url'][i] == (
+        enento20en = _row(pd_data, '710')
+        assert enento20en['json_url'] == (
             'https://filings.xbrl.org/743700EPLUWXE25HGM03/2020-12-31/ESEF/FI'
             '/0/ENENTO-2020-12-31 EN.json'
             )
-        assert pd_data['package_url'][i] == (
+        assert enento20en['package_url'] == (
             'https://filings.xbrl.org/743700EPLUWXE25HGM03/2020-12-31/ESEF/FI'
             '/0/ENENTO-2020-12-31_EN.zip'
             )
-        assert pd_data['viewer_url'][i] == (
+        assert enento20en['viewer_url'] == (
             'https://filings.xbrl.org/743700EPLUWXE25HGM03/2020-12-31/ESEF/FI'
             '/0/ENENTO-2020-12-31_EN/reports/ixbrlviewer.html'
             )
-        assert pd_data['xhtml_url'][i] == (
+        assert enento20en['xhtml_url'] == (
             'https://filings.xbrl.org/743700EPLUWXE25HGM03/2020-12-31/ESEF/FI'
             '/0/ENENTO-2020-12-31_EN/reports/ENENTO-2020-12-31 EN.html'
             )
-        assert pd_data['request_url'][i].startswith(
+        assert enento20en['request_url'].startswith(
             'https://filings.xbrl.org/api/filings?')
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     def test_with_entity_include_urls_both_true(
-            self, get_oldest3_fi_entities_filingset, monkeypatch):
+            self, oldest3_fi_entities_filingset, monkeypatch):
         """Test with_entity=True and include_urls=True, unit testing."""
         monkeypatch.setattr(
             xf.options, 'entry_point_url', 'https://filings.xbrl.org/api')
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=True,
@@ -225,22 +226,20 @@ class TestFilingSet_get_pandas_data:
             include_urls=True,
             include_paths=False
             )
-        i = pd_data['api_id'].index('710')
+        enento20en = _row(pd_data, '710')
         assert 'entity_api_id' not in pd_data
-        assert pd_data['entity.api_id'][i] == '548'
-        assert pd_data['entity.identifier'][i] == '743700EPLUWXE25HGM03'
-        assert pd_data['entity.name'][i] == 'Enento Group Oyj'
-        assert pd_data['entity.api_entity_filings_url'][i] == (
+        assert enento20en['entity.api_id'] == '548'
+        assert enento20en['entity.identifier'] == '743700EPLUWXE25HGM03'
+        assert enento20en['entity.name'] == 'Enento Group Oyj'
+        assert enento20en['entity.api_entity_filings_url'] == (
             'https://filings.xbrl.org/api/entities/743700EPLUWXE25HGM03'
             '/filings'
             )
-        assert isinstance(pd_data['entity.query_time'][i], datetime)
-        assert pd_data['entity.request_url'][i].startswith(
+        assert isinstance(enento20en['entity.query_time'], datetime)
+        assert enento20en['entity.request_url'].startswith(
             'https://filings.xbrl.org/api/filings?')
-        assert 'entity.filings' not in pd_data
-        assert 'entity' not in pd_data
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert not {'entity.filings', 'entity'} & pd_data.keys()
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     def test_include_paths_true_has_downloaded(self, get_oldest3_fi_filingset):
         """
@@ -260,19 +259,18 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=True
             )
-        i = pd_data['api_id'].index('710')
-        assert pd_data['json_download_path'][i] == 'test_json'
-        assert pd_data['package_download_path'][i] == 'test_package'
-        assert pd_data['xhtml_download_path'][i] == 'test_xhtml'
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
-
-    def test_include_paths_true_not_downloaded(self, get_oldest3_fi_filingset):
+        enento20en = _row(pd_data, '710')
+        assert enento20en['json_download_path'] == 'test_json'
+        assert enento20en['package_download_path'] == 'test_package'
+        assert enento20en['xhtml_download_path'] == 'test_xhtml'
+        assert {'507', '1495'} <= set(pd_data['api_id'])
+
+    def test_include_paths_true_not_downloaded(self, oldest3_fi_filingset):
         """
         Test include_paths=True but no filings were downloaded, unit
         testing.
         """
-        fs: xf.FilingSet = get_oldest3_fi_filingset()
+        fs: xf.FilingSet = oldest3_fi_filingset
         pd_data = fs.get_pandas_data(
             attr_names=None,
             with_entity=False,
@@ -281,11 +279,11 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=True
             )
-        assert 'json_download_path' not in pd_data
-        assert 'package_download_path' not in pd_data
-        assert 'xhtml_download_path' not in pd_data
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert not {
+            'json_download_path', 'package_download_path',
+            'xhtml_download_path'
+            } & pd_data.keys()
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
     def test_include_paths_false_has_downloaded(
             self, get_oldest3_fi_filingset):
@@ -306,11 +304,11 @@ class TestFilingSet_get_pandas_data:
             include_urls=False,
             include_paths=False
             )
-        assert 'json_download_path' not in pd_data
-        assert 'package_download_path' not in pd_data
-        assert 'xhtml_download_path' not in pd_data
-        assert '507' in pd_data['api_id']
-        assert '1495' in pd_data['api_id']
+        assert not {
+            'json_download_path', 'package_download_path',
+            'xhtml_download_path'
+            } & pd_data.keys()
+        assert {'507', '1495'} <= set(pd_data['api_id'])
 
 
 class TestResourceCollection_entities_get_pandas_data:
@@ -319,50 +317,47 @@ class TestResourceCollection_entities_get_pandas_data:
     FilingSet.entities, unit testing.
     """
 
-    def test_e_defaults(self, get_oldest3_fi_entities_filingset):
+    def test_e_defaults(self, oldest3_fi_entities_filingset):
         """
         Test default parameter values for
         ResourceCollection[entities].get_pandas_data, unit testing.
         """
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.entities.get_pandas_data(
             attr_names=None,
             strip_timezone=True,
             date_as_datetime=True,
             include_urls=False
             )
-        i = pd_data['api_id'].index('548')
-        assert pd_data['identifier'][i] == '743700EPLUWXE25HGM03'
-        assert pd_data['name'][i] == 'Enento Group Oyj'
+        enento = _row(pd_data, '548')
+        assert enento['identifier'] == '743700EPLUWXE25HGM03'
+        assert enento['name'] == 'Enento Group Oyj'
         assert 'api_entity_filings_url' not in pd_data
-        assert isinstance(pd_data['query_time'][i], datetime)
-        assert 'request_url' not in pd_data
-        assert 'filings' not in pd_data
-        assert '383' in pd_data['api_id']
-        assert '1120' in pd_data['api_id']
+        assert isinstance(enento['query_time'], datetime)
+        assert not {'request_url', 'filings'} & pd_data.keys()
+        assert {'383', '1120'} <= set(pd_data['api_id'])
 
-    def test_e_attr_names_2cols(self, get_oldest3_fi_entities_filingset):
+    def test_e_attr_names_2cols(self, oldest3_fi_entities_filingset):
         """
         Test attr_names defining 2 columns, unit testing, entities.
         """
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.entities.get_pandas_data(
             attr_names=['api_id', 'name'],
             strip_timezone=True,
             date_as_datetime=True,
             include_urls=False
             )
-        i = pd_data['api_id'].index('548')
+        enento = _row(pd_data, '548')
         assert len(pd_data) == 2
-        assert pd_data['name'][i] == 'Enento Group Oyj'
-        assert '383' in pd_data['api_id']
-        assert '1120' in pd_data['api_id']
+        assert enento['name'] == 'Enento Group Oyj'
+        assert {'383', '1120'} <= set(pd_data['api_id'])
 
     @pytest.mark.datetime
     def test_e_strip_timezone_true(
-            self, get_oldest3_fi_entities_filingset):
+            self, oldest3_fi_entities_filingset):
         """Test strip_timezone=True, unit testing, entities."""
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.entities.get_pandas_data(
             attr_names=None,
             strip_timezone=True,
@@ -374,9 +369,9 @@ class TestResourceCollection_entities_get_pandas_data:
             assert pd_data['query_time'][i].tzinfo is None
 
     @pytest.mark.datetime
-    def test_e_strip_timezone_false(self, get_oldest3_fi_entities_filingset):
+    def test_e_strip_timezone_false(self, oldest3_fi_entities_filingset):
         """Test strip_timezone=False, unit testing, entities."""
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.entities.get_pandas_data(
             attr_names=None,
             strip_timezone=False,
@@ -388,26 +383,25 @@ class TestResourceCollection_entities_get_pandas_data:
             assert pd_data['query_time'][i].tzinfo is not None
 
     def test_e_include_urls_true(
-            self, get_oldest3_fi_entities_filingset, monkeypatch):
+            self, oldest3_fi_entities_filingset, monkeypatch):
         """Test include_urls=True, unit testing, entities."""
         monkeypatch.setattr(
             xf.options, 'entry_point_url', 'https://filings.xbrl.org/api')
-        fs: xf.FilingSet = get_oldest3_fi_entities_filingset()
+        fs: xf.FilingSet = oldest3_fi_entities_filingset
         pd_data = fs.entities.get_pandas_data(
             attr_names=None,
             strip_timezone=True,
             date_as_datetime=True,
             include_urls=True
             )
-        i = pd_data['api_id'].index('548')
-        assert pd_data['api_entity_filings_url'][i] == (
+        enento = _row(pd_data, '548')
+        assert enento['api_entity_filings_url'] == (
             'https://filings.xbrl.org/api/entities/743700EPLUWXE25HGM03'
             '/filings'
             )
-        assert pd_data['request_url'][i].startswith(
+        assert enento['request_url'].startswith(
             'https://filings.xbrl.org/')
-        assert '383' in pd_data['api_id']
-        assert '1120' in pd_data['api_id']
+        assert {'383', '1120'} <= set(pd_data['api_id'])
 
 
 class TestResourceCollection_validation_messages_get_pandas_data:
@@ -416,27 +410,19 @@ class TestResourceCollection_validation_messages_get_pandas_data:
     FilingSet.validation_messages, unit testing.
     """
 
-    def test_vm_defaults(self, get_oldest3_fi_vmessages_filingset):
+    def test_vm_defaults(self, oldest3_fi_vmessages_filingset):
         """
         Test default parameter values for
         ResourceCollection[validation_messages].get_pandas_data, unit
         testing.
         """
-        e_api_ids = {
-            '5464', '5465', '5466', '5467', '5468', '5469', '5470', '5471',
-            '5472', '5473', '5474', '5475', '5476', '5477', '5478', '8662',
-            '8663', '8664', '8665', '8666', '8667', '8668', '8669', '8670',
-            '8671', '8672', '8673', '8674', '8675', '8676', '8677', '8678',
-            '8679', '8680', '16748', '16749', '16750', '16751', '16752',
-            '16753', '16754', '16755', '16756', '16757', '16758'
-            }
         e_5464_text = (
             'Calculation inconsistent from ifrs-full:NoncurrentAssets in link '
             'role http://www.oriola.com/roles/Assets reported sum 537,300,000 '
             'computed sum 537,400,000 context c-3 unit u-1 '
             'unreportedContributingItems none'
             )
-        fs: xf.FilingSet = get_oldest3_fi_vmessages_filingset()
+        fs: xf.FilingSet = oldest3_fi_vmessages_filingset
         vmsg_5464: xf.ValidationMessage = next(filter(
             lambda vmsg: vmsg.api_id == '5464', fs.validation_messages))
         pd_data = fs.validation_messages.get_pandas_data(
@@ -445,50 +431,39 @@ class TestResourceCollection_validation_messages_get_pandas_data:
             date_as_datetime=True,
             include_urls=False
             )
-        i = pd_data['api_id'].index('5464')
-        assert len(pd_data['api_id']) == len(e_api_ids)
-        assert pd_data['severity'][i] == 'INCONSISTENCY'
-        assert pd_data['text'][i] == e_5464_text
-        assert pd_data['code'][i] == 'xbrl.5.2.5.2:calcInconsistency'
-        assert pd_data['filing_api_id'][i] == '507'
-        assert pd_data['calc_computed_sum'][i] == vmsg_5464.calc_computed_sum
-        assert pd_data['calc_reported_sum'][i] == vmsg_5464.calc_reported_sum
-        assert pd_data['calc_context_id'][i] == vmsg_5464.calc_context_id
-        assert pd_data['calc_line_item'][i] == vmsg_5464.calc_line_item
-        assert pd_data['calc_short_role'][i] == vmsg_5464.calc_short_role
-        assert pd_data['calc_unreported_items'][i] == (
+        row_5464 = _row(pd_data, '5464')
+        assert len(pd_data['api_id']) == len(OLDEST3_FI_VMSG_API_IDS)
+        assert row_5464['severity'] == 'INCONSISTENCY'
+        assert row_5464['text'] == e_5464_text
+        assert row_5464['code'] == 'xbrl.5.2.5.2:calcInconsistency'
+        assert row_5464['filing_api_id'] == '507'
+        assert row_5464['calc_computed_sum'] == vmsg_5464.calc_computed_sum
+        assert row_5464['calc_reported_sum'] == vmsg_5464.calc_reported_sum
+        assert row_5464['calc_context_id'] == vmsg_5464.calc_context_id
+        assert row_5464['calc_line_item'] == vmsg_5464.calc_line_item
+        assert row_5464['calc_short_role'] == vmsg_5464.calc_short_role
+        assert row_5464['calc_unreported_items'] == (
             vmsg_5464.calc_unreported_items)
-        assert pd_data['duplicate_greater'][i] is None
-        assert pd_data['duplicate_lesser'][i] is None
-        assert isinstance(pd_data['query_time'][i], datetime)
-        assert 'request_url' not in pd_data
-        assert 'filing' not in pd_data
-        for e_api_id in e_api_ids:
-            assert e_api_id in pd_data['api_id']
-
-    def test_vm_attr_names_2cols(self, get_oldest3_fi_vmessages_filingset):
+        assert row_5464['duplicate_greater'] is None
+        assert row_5464['duplicate_lesser'] is None
+        assert isinstance(row_5464['query_time'], datetime)
+        assert not {'request_url', 'filing'} & pd_data.keys()
+        assert OLDEST3_FI_VMSG_API_IDS <= set(pd_data['api_id'])
+
+    def test_vm_attr_names_2cols(self, oldest3_fi_vmessages_filingset):
         """
         Test attr_names defining 2 columns, unit testing,
         validation_messages.
         """
-        e_api_ids = {
-            '5464', '5465', '5466', '5467', '5468', '5469', '5470', '5471',
-            '5472', '5473', '5474', '5475', '5476', '5477', '5478', '8662',
-            '8663', '8664', '8665', '8666', '8667', '8668', '8669', '8670',
-            '8671', '8672', '8673', '8674', '8675', '8676', '8677', '8678',
-            '8679', '8680', '16748', '16749', '16750', '16751', '16752',
-            '16753', '16754', '16755', '16756', '16757', '16758'
-            }
-        fs: xf.FilingSet = get_oldest3_fi_vmessages_filingset()
+        fs: xf.FilingSet = oldest3_fi_vmessages_filingset
         pd_data = fs.validation_messages.get_pandas_data(
             attr_names=['api_id', 'severity'],
             strip_timezone=True,
             date_as_datetime=True,
             include_urls=False
             )
-        i = pd_data['api_id'].index('5464')
-        assert len(pd_data['api_id']) == len(e_api_ids)
+        row_5464 = _row(pd_data, '5464')
+        assert len(pd_data['api_id']) == len(OLDEST3_FI_VMSG_API_IDS)
         assert len(pd_data) == 2
-        assert pd_data['severity'][i] == 'INCONSISTENCY'
-        for e_api_id in e_api_ids:
-            assert e_api_id in pd_data['api_id']
+        assert row_5464['severity'] == 'INCONSISTENCY'
+        assert OLDEST3_FI_VMSG_API_IDS <= set(pd_data['api_id'])
@@ -4,10 +4,6 @@
 #
 # SPDX-License-Identifier: MIT
 
-# Allow unnecessary double quotes as file includes SQL statements.
-# ruff: noqa: Q000
-
-import sqlite3
 from datetime import datetime, timezone
 
 import pytest
@@ -15,54 +11,89 @@ import pytest
 import xbrl_filings_api as xf
 
 UTC = timezone.utc
-
-pytestmark = pytest.mark.multifilter
-
-
-def test_get_filings_api_id(multifilter_api_id_response):
-    """Requested `api_id` filings are returned."""
-    shell_api_ids = '1134', '1135', '4496', '4529'
+SHELL_API_IDS = '1134', '1135', '4496', '4529'
+FILING_INDEX_CODES = (
+    '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
+    '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
+    )
+REPORTING_DATES = '2020-12-31', '2021-12-31', '2022-12-31'
+CLOETTA_SV_STRS = (
+    '2023-01-18 11:02:06.724768',
+    '2023-05-16 21:07:17.825836'
+    )
+CLOETTA_SV_OBJS = (
+    datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
+    datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
+    )
+
+pytestmark = [pytest.mark.multifilter, pytest.mark.usefixtures('no_views')]
+
+
+@pytest.mark.parametrize(('mock_response', 'filters'), [
+    pytest.param(
+        'multifilter_api_id_response', {'api_id': SHELL_API_IDS},
+        id='api_id'),
+    pytest.param(
+        'multifilter_filing_index_response',
+        {'filing_index': FILING_INDEX_CODES},
+        id='filing_index'),
+    ], indirect=['mock_response'])
+def test_get_filings_multifilter(mock_response, filters):
+    """Filings with the requested values of the field are returned."""
+    [(field, values)] = filters.items()
     fs = xf.get_filings(
-        filters={
-            'api_id': shell_api_ids
-            },
+        filters=filters,
         sort=None,
-        limit=4,
+        limit=len(values),
         flags=xf.GET_ONLY_FILINGS
         )
-    received_api_ids = {filing.api_id for filing in fs}
-    assert received_api_ids == set(shell_api_ids)
+    received_values = {getattr(filing, field) for filing in fs}
+    assert received_values == set(values)
 
 
 @pytest.mark.sqlite
-def test_to_sqlite_api_id(
-        multifilter_api_id_response, db_record_count, tmp_path, monkeypatch):
-    """Filtering by `api_id` inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    shell_api_ids = '1134', '1135', '4496', '4529'
-    db_path = tmp_path / 'test_to_sqlite_api_id.db'
+@pytest.mark.parametrize(('mock_response', 'query', 'e_counts'), [
+    pytest.param(
+        'multifilter_api_id_response',
+        {'filters': {'api_id': SHELL_API_IDS}, 'limit': 4},
+        dict.fromkeys(SHELL_API_IDS, 1),
+        id='api_id'),
+    pytest.param(
+        'multifilter_country_response',
+        {'filters': {'country': ['FI', 'SE', 'NO']}, 'limit': 3},
+        {'FI': 3},
+        id='country_only_first'),
+    pytest.param(
+        'multifilter_filing_index_response',
+        {'filters': {'filing_index': FILING_INDEX_CODES}, 'limit': 2},
+        dict.fromkeys(FILING_INDEX_CODES, 1),
+        id='filing_index'),
+    pytest.param(
+        'multifilter_processed_time_response',
+        {'filters': {'processed_time': CLOETTA_SV_STRS}, 'limit': 2},
+        dict.fromkeys(CLOETTA_SV_STRS, 1),
+        marks=pytest.mark.datetime, id='processed_time_str'),
+    ], indirect=['mock_response'])
+def test_to_sqlite_multifilter(
+        mock_response, query, e_counts, db_column_counts, tmp_path):
+    """
+    Filings filtered by multifilter are inserted into a database.
+
+    Parameter `query` gives the ``filters`` and ``limit`` arguments. In
+    the `country` case, the limit only fits filings of the first
+    country, FI.
+    """
+    [field] = query['filters']
+    db_path = tmp_path / 'test_to_sqlite_multifilter.db'
     xf.to_sqlite(
         path=db_path,
         update=False,
-        filters={
-            'api_id': shell_api_ids
-            },
         sort=None,
-        limit=4,
-        flags=xf.GET_ONLY_FILINGS
+        flags=xf.GET_ONLY_FILINGS,
+        **query
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT api_id FROM Filing "
-        "WHERE api_id IN (?, ?, ?, ?)",
-        shell_api_ids
-        )
-    saved_ids = {row[0] for row in cur.fetchall()}
-    assert saved_ids == set(shell_api_ids)
-    assert db_record_count(cur) == 4
-    con.close()
+    assert db_column_counts(db_path, field) == e_counts
 
 
 def test_get_filings_country_only_first(multifilter_country_response):
@@ -83,99 +114,13 @@ def test_get_filings_country_only_first(multifilter_country_response):
     assert 'NO' not in received_countries, 'Too many FI filings'
 
 
-@pytest.mark.sqlite
-def test_to_sqlite_country_only_first(
-        multifilter_country_response, db_record_count, tmp_path, monkeypatch):
-    """Filtering by `country` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    country_codes = ['FI', 'SE', 'NO']
-    db_path = tmp_path / 'test_to_sqlite_country_only_first.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'country': country_codes
-            },
-        sort=None,
-        limit=3,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT country FROM Filing "
-        "WHERE country IN (?, ?, ?)",
-        country_codes
-        )
-    saved_countries = {row[0] for row in cur.fetchall()}
-    assert saved_countries == {'FI'}
-    assert db_record_count(cur) == 3
-    con.close()
-
-
-def test_get_filings_filing_index(
-        multifilter_filing_index_response):
-    """Requested `filing_index` filings are returned."""
-    filing_index_codes = (
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
-        )
-    fs = xf.get_filings(
-        filters={
-            'filing_index': filing_index_codes
-            },
-        sort=None,
-        limit=2,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    received_countries = {filing.filing_index for filing in fs}
-    assert received_countries == set(filing_index_codes)
-
-
-@pytest.mark.sqlite
-def test_to_sqlite_filing_index(
-        multifilter_filing_index_response, db_record_count, tmp_path,
-        monkeypatch):
-    """Filtering by `filing_index` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    filing_index_codes = (
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
-        )
-    db_path = tmp_path / 'test_to_sqlite_filing_index.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'filing_index': filing_index_codes
-            },
-        sort=None,
-        limit=2,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT filing_index FROM Filing "
-        "WHERE filing_index IN (?, ?)",
-        filing_index_codes
-        )
-    saved_fxo = {row[0] for row in cur.fetchall()}
-    assert saved_fxo == set(filing_index_codes)
-    assert db_record_count(cur) == 2
-    con.close()
-
-
 def test_get_filings_reporting_date(multifilter_reporting_date_response):
     """Test raising APIError for `reporting_date` filtering."""
-    dates = '2020-12-31', '2021-12-31', '2022-12-31'
     with pytest.raises(xf.APIError, match=r'FilingSchema has no attribute'):
         with pytest.warns(xf.FilterNotSupportedWarning):
             _ = xf.get_filings(
                 filters={
-                    'reporting_date': dates
+                    'reporting_date': REPORTING_DATES
                     },
                 sort=None,
                 limit=3,
@@ -185,12 +130,10 @@ def test_get_filings_reporting_date(multifilter_reporting_date_response):
 
 @pytest.mark.sqlite
 def test_to_sqlite_reporting_date(
-        multifilter_reporting_date_response, tmp_path, monkeypatch):
+        multifilter_reporting_date_response, tmp_path):
     """
     Test raising APIError for `reporting_date` filtering, to_sqlite.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
-    dates = '2020-12-31', '2021-12-31', '2022-12-31'
     db_path = tmp_path / 'test_to_sqlite_reporting_date.db'
     with pytest.raises(xf.APIError, match=r'FilingSchema has no attribute'):
         with pytest.warns(xf.FilterNotSupportedWarning):
@@ -198,7 +141,7 @@ def test_to_sqlite_reporting_date(
                 path=db_path,
                 update=False,
                 filters={
-                    'reporting_date': dates
+                    'reporting_date': REPORTING_DATES
                     },
                 sort=None,
                 limit=3,
@@ -211,65 +154,21 @@ def test_to_sqlite_reporting_date(
 def test_get_filings_processed_time_str(
         multifilter_processed_time_response):
     """Test string filtered `processed_time` returns 2 filings."""
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
-        )
     fs = xf.get_filings(
         filters={
-            'processed_time': cloetta_sv_strs
+            'processed_time': CLOETTA_SV_STRS
             },
         sort=None,
         limit=2,
         flags=xf.GET_ONLY_FILINGS
         )
     received_dts = {filing.processed_time for filing in fs}
-    assert cloetta_sv_objs[0] in received_dts
-    assert cloetta_sv_objs[1] in received_dts
+    assert CLOETTA_SV_OBJS[0] in received_dts
+    assert CLOETTA_SV_OBJS[1] in received_dts
     assert len(received_dts) == 2
     received_strs = {filing.processed_time_str for filing in fs}
-    assert cloetta_sv_strs[0] in received_strs
-    assert cloetta_sv_strs[1] in received_strs
-
-
-@pytest.mark.sqlite
-@pytest.mark.datetime
-def test_to_sqlite_processed_time_str(
-        multifilter_processed_time_response, db_record_count, tmp_path,
-        monkeypatch):
-    """Test string filtered `processed_time` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
-    db_path = tmp_path / 'test_to_sqlite_processed_time_str.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'processed_time': cloetta_sv_strs
-            },
-        sort=None,
-        limit=2,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT processed_time FROM Filing "
-        "WHERE processed_time IN (?, ?)",
-        cloetta_sv_strs
-        )
-    saved_proc_times = {row[0] for row in cur.fetchall()}
-    assert saved_proc_times == set(cloetta_sv_strs)
-    assert db_record_count(cur) == 2
-    con.close()
+    assert CLOETTA_SV_STRS[0] in received_strs
+    assert CLOETTA_SV_STRS[1] in received_strs
 
 
 @pytest.mark.datetime
@@ -278,17 +177,9 @@ def test_get_filings_processed_time_datetime_utc(
     """
     Test datetime (UTC) filtered `processed_time` returns 2 filings.
     """
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
-        )
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
     fs = xf.get_filings(
         filters={
-            'processed_time': cloetta_sv_objs
+            'processed_time': CLOETTA_SV_OBJS
             },
         sort=None,
         limit=2,
@@ -296,11 +187,11 @@ def test_get_filings_processed_time_datetime_utc(
         )
     received_dts = {filing.processed_time for filing in fs}
     assert len(received_dts) == 2
-    for utc_dt in cloetta_sv_objs:
+    for utc_dt in CLOETTA_SV_OBJS:
         assert utc_dt in received_dts
     received_strs = {filing.processed_time_str for filing in fs}
     assert len(received_strs) == 2
-    for str_dt in cloetta_sv_strs:
+    for str_dt in CLOETTA_SV_STRS:
         assert str_dt in received_strs
 
 
@@ -310,17 +201,10 @@ def test_get_filings_processed_time_datetime_naive(
     """
     Test datetime (naive) filtered `processed_time` returns 2 filings.
     """
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=None),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=None)
-        )
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
+    naive_dts = tuple(dt.replace(tzinfo=None) for dt in CLOETTA_SV_OBJS)
     fs = xf.get_filings(
         filters={
-            'processed_time': cloetta_sv_objs
+            'processed_time': naive_dts
             },
         sort=None,
         limit=2,
@@ -328,10 +212,10 @@ def test_get_filings_processed_time_datetime_naive(
         )
     received_dts = {filing.processed_time for filing in fs}
     assert len(received_dts) == 2
-    for naive_dt in cloetta_sv_objs:
+    for naive_dt in naive_dts:
         assert naive_dt.replace(tzinfo=UTC) in received_dts
     received_strs = {filing.processed_time_str for filing in fs}
-    for str_dt in cloetta_sv_strs:
+    for str_dt in CLOETTA_SV_STRS:
         assert str_dt in received_strs
 
 
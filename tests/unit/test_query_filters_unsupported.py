@@ -23,16 +23,10 @@ import xbrl_filings_api as xf
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_error_count(filter_error_count_response):
+def test_get_filings_error_count(
+        filter_error_count_response, one_filing_query):
     """Filtering by `error_count` value 1 return one filing."""
-    fs = xf.get_filings(
-        filters={
-            'error_count': 0
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'error_count': 0})
     filing = next(iter(fs), None)
     assert isinstance(filing, xf.Filing)
     assert filing.error_count == 0
@@ -44,16 +38,10 @@ def test_get_filings_error_count(filter_error_count_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_inconsistency_count(filter_inconsistency_count_response):
+def test_get_filings_inconsistency_count(
+        filter_inconsistency_count_response, one_filing_query):
     """Requested `inconsistency_count` filings are returned."""
-    fs = xf.get_filings(
-        filters={
-            'inconsistency_count': 0
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'inconsistency_count': 0})
     filing = next(iter(fs), None)
     assert isinstance(filing, xf.Filing)
     assert filing.inconsistency_count == 0
@@ -65,16 +53,10 @@ def test_get_filings_inconsistency_count(filter_inconsistency_count_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_warning_count(filter_warning_count_response):
+def test_get_filings_warning_count(
+        filter_warning_count_response, one_filing_query):
     """Requested `warning_count` filings are returned."""
-    fs = xf.get_filings(
-        filters={
-            'warning_count': 0
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'warning_count': 0})
     filing = next(iter(fs), None)
     assert isinstance(filing, xf.Filing)
     assert filing.warning_count == 0
@@ -86,20 +68,13 @@ def test_get_filings_warning_count(filter_warning_count_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_json_url(filter_json_url_response):
+def test_get_filings_json_url(filter_json_url_response, one_filing_query):
     """Filtering by `json_url` return one filing."""
     json_url = (
         '/2138001CNF45JP5XZK38/2022-12-31/ESEF/FI/0/2138001CNF45JP5XZK38-'
         '2022-12-31-en.json'
         )
-    fs = xf.get_filings(
-        filters={
-            'json_url': json_url
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'json_url': json_url})
     kone22en = next(iter(fs), None)
     assert isinstance(kone22en, xf.Filing)
     assert kone22en.json_url.endswith(json_url)
@@ -111,20 +86,14 @@ def test_get_filings_json_url(filter_json_url_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_package_url(filter_package_url_response):
+def test_get_filings_package_url(
+        filter_package_url_response, one_filing_query):
     """Filtering by `package_url` return one filing."""
     package_url = (
         '/2138001CNF45JP5XZK38/2022-12-31/ESEF/FI/0/'
         '2138001CNF45JP5XZK38-2022-12-31-EN.zip'
         )
-    fs = xf.get_filings(
-        filters={
-            'package_url': package_url
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'package_url': package_url})
     kone22en = next(iter(fs), None)
     assert isinstance(kone22en, xf.Filing)
     assert kone22en.package_url.endswith(package_url)
@@ -136,20 +105,13 @@ def test_get_filings_package_url(filter_package_url_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_viewer_url(filter_viewer_url_response):
+def test_get_filings_viewer_url(filter_viewer_url_response, one_filing_query):
     """Filtering by `viewer_url` return one filing."""
     viewer_url = (
         '/2138001CNF45JP5XZK38/2022-12-31/ESEF/FI/0/2138001CNF45JP5XZK38-'
         '2022-12-31-EN/reports/ixbrlviewer.html'
         )
-    fs = xf.get_filings(
-        filters={
-            'viewer_url': viewer_url
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'viewer_url': viewer_url})
     kone22en = next(iter(fs), None)
     assert isinstance(kone22en, xf.Filing)
     assert kone22en.viewer_url.endswith(viewer_url)
@@ -161,20 +123,13 @@ def test_get_filings_viewer_url(filter_viewer_url_response):
         'API.'
         ),
     raises=xf.APIError)
-def test_get_filings_xhtml_url(filter_xhtml_url_response):
+def test_get_filings_xhtml_url(filter_xhtml_url_response, one_filing_query):
     """Filtering by `xhtml_url` return one filing."""
     xhtml_url = (
         '/2138001CNF45JP5XZK38/2022-12-31/ESEF/FI/0/2138001CNF45JP5XZK38-'
         '2022-12-31-EN/reports/2138001CNF45JP5XZK38-2022-12-31-en.html'
         )
-    fs = xf.get_filings(
-        filters={
-            'xhtml_url': xhtml_url
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
+    fs = one_filing_query(filters={'xhtml_url': xhtml_url})
     kone22en = next(iter(fs), None)
     assert isinstance(kone22en, xf.Filing)
     assert kone22en.xhtml_url.endswith(xhtml_url)
@@ -4,89 +4,50 @@
 #
 # SPDX-License-Identifier: MIT
 
-import xbrl_filings_api as xf
-
-
-def test_get_filings_flag_only_filings(asml22en_response):
-    """Test if function returns the filing according to `flags`."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    asml22 = next(iter(fs), None)
-    assert asml22.entity is None, 'No entities'
-    assert asml22.validation_messages is None, 'No messages'
-
-
-def test_get_filings_flag_entities(asml22en_entities_response):
-    """Test if function returns the filing with `entity`."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ENTITY
-        )
-    asml22 = next(iter(fs), None)
-    assert asml22.validation_messages is None, 'No messages'
-    assert isinstance(asml22.entity, xf.Entity), 'xf.Entity is available'
-    assert asml22.entity.name == 'ASML Holding N.V.', 'Accessible'
-
-
-def test_get_filings_flag_vmessages(asml22en_vmessages_response):
-    """Function returns the filing with `validation_messages`."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_VALIDATION_MESSAGES
-        )
-    asml22 = next(iter(fs), None)
-    assert asml22.entity is None, 'No entity'
-    vmsg = next(iter(asml22.validation_messages), None)
-    assert isinstance(vmsg, xf.ValidationMessage), 'Messages available'
-    assert isinstance(vmsg.text, str), 'Messages accessible'
-
-
-def test_get_filings_flag_only_filings_and_entities(asml22en_response):
-    """`xf.GET_ONLY_FILINGS` is stronger than `xf.GET_ENTITY`."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS | xf.GET_ENTITY
-        )
-    asml22 = next(iter(fs), None)
-    assert asml22.entity is None, 'No entities'
-    assert asml22.validation_messages is None, 'No messages'
+import pytest
 
+import xbrl_filings_api as xf
 
-def test_get_filings_flag_entities_vmessages(asml22en_ent_vmsg_response):
-    """Get entities and validation messages."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
-        )
+ASML22_FXO = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
+
+
+@pytest.mark.parametrize(
+    ('mock_response', 'flags', 'e_entity', 'e_vmessages'), [
+        pytest.param(
+            'asml22en_response', xf.GET_ONLY_FILINGS, False, False,
+            id='only_filings'),
+        pytest.param(
+            'asml22en_entities_response', xf.GET_ENTITY, True, False,
+            id='entities'),
+        pytest.param(
+            'asml22en_vmessages_response', xf.GET_VALIDATION_MESSAGES,
+            False, True, id='vmessages'),
+        pytest.param(
+            'asml22en_response', xf.GET_ONLY_FILINGS | xf.GET_ENTITY,
+            False, False, id='only_filings_and_entities'),
+        pytest.param(
+            'asml22en_ent_vmsg_response',
+            xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES, True, True,
+            id='entities_vmessages'),
+        ], indirect=['mock_response'])
+def test_get_filings_flags(
+        mock_response, flags, e_entity, e_vmessages, one_filing_query):
+    """
+    Test if function returns the filing with `entity` and
+    `validation_messages` according to `flags`.
+
+    `xf.GET_ONLY_FILINGS` is stronger than `xf.GET_ENTITY`.
+    """
+    fs = one_filing_query(filters={'filing_index': ASML22_FXO}, flags=flags)
     asml22 = next(iter(fs), None)
-    assert isinstance(asml22.entity, xf.Entity), 'xf.Entity available'
-    vmsg = next(iter(asml22.validation_messages), None)
-    assert isinstance(vmsg, xf.ValidationMessage), 'Messages available'
-    assert isinstance(vmsg.text, str), 'Messages accessible'
+    if e_entity:
+        assert isinstance(asml22.entity, xf.Entity), 'xf.Entity available'
+        assert asml22.entity.name == 'ASML Holding N.V.', 'Accessible'
+    else:
+        assert asml22.entity is None, 'No entity'
+    if e_vmessages:
+        vmsg = next(iter(asml22.validation_messages), None)
+        assert isinstance(vmsg, xf.ValidationMessage), 'Messages available'
+        assert isinstance(vmsg.text, str), 'Messages accessible'
+    else:
+        assert asml22.validation_messages is None, 'No messages'
@@ -14,38 +14,29 @@ import pytest
 import xbrl_filings_api as xf
 
 UTC = timezone.utc
+OLDEST3_FI_ADDED_TIME_MAX = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
+NESTE20EN_FXO = '5493009GY1X8GQ66AM14-2020-12-31-ESEF-FI-0'
+NESTE20FI_FXO = '5493009GY1X8GQ66AM14-2020-12-31-ESEF-FI-1'
 
 
 @pytest.mark.datetime
-def test_sort_oldest_finnish_str(oldest3_fi_response, monkeypatch):
-    """Sort by string `added_time` for filings from Finland."""
+@pytest.mark.parametrize('sort', [
+    pytest.param('added_time', id='str'),
+    pytest.param(['added_time'], id='list'),
+    ])
+def test_sort_oldest_finnish(oldest3_fi_response, sort):
+    """Sort by `added_time` as str or list for filings from Finland."""
     fs = xf.get_filings(
         filters={
             'country': 'FI'
             },
-        sort='added_time',
+        sort=sort,
         limit=3,
         flags=xf.GET_ONLY_FILINGS
         )
-    date_max = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
     for f in fs:
-        assert f.added_time < date_max, 'Before 2021-05-18T00:00:01Z'
-
-
-@pytest.mark.datetime
-def test_sort_oldest_finnish_list(oldest3_fi_response, monkeypatch):
-    """Sort by list of string `added_time` for filings from Finland."""
-    fs = xf.get_filings(
-        filters={
-            'country': 'FI'
-            },
-        sort=['added_time'],
-        limit=3,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    date_max = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
-    for f in fs:
-        assert f.added_time < date_max, 'Before 2021-05-18T00:00:01Z'
+        assert f.added_time < OLDEST3_FI_ADDED_TIME_MAX, (
+            'Before 2021-05-18T00:00:01Z')
 
 
 def test_sort_two_fields(sort_two_fields_response):
@@ -68,12 +59,8 @@ def test_sort_two_fields(sort_two_fields_response):
         flags=xf.GET_ONLY_FILINGS
         )
     assert len(fs) == 2, 'Two filings were requested'
-    filing_indexes = {f.filing_index for f in fs}
     # TODO: Must be checked from full database output
-    neste20en_fxo = '5493009GY1X8GQ66AM14-2020-12-31-ESEF-FI-0'
-    assert neste20en_fxo in filing_indexes
-    neste20fi_fxo = '5493009GY1X8GQ66AM14-2020-12-31-ESEF-FI-1'
-    assert neste20fi_fxo in filing_indexes
+    assert {f.filing_index for f in fs} == {NESTE20EN_FXO, NESTE20FI_FXO}
 
 
 def test_sort_asc_package_sha256(sort_asc_package_sha256_latvia_response):
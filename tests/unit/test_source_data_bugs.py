@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: MIT
 
+from itertools import islice
+
 import pytest
 
 import xbrl_filings_api as xf
@@ -30,14 +32,6 @@ def test_paging_sort_added_time(
         limit=5,
         flags=xf.GET_ONLY_FILINGS
         )
-    page1 = next(piter, None)
-    assert isinstance(page1, xf.FilingsPage)
-    assert len(page1.filing_list) == 2, 'Get 2 unique filings'
-    page2 = next(piter, None)
-    assert isinstance(page2, xf.FilingsPage)
-    assert len(page2.filing_list) == 2, 'Get 2 prev unique filings, not 1'
-    page3 = next(piter, None)
-    assert isinstance(page3, xf.FilingsPage)
-    assert len(page3.filing_list) == 2, 'Get 2 prev unique filings, not 1'
-    page_none = next(piter, None)
-    assert page_none is None, 'Forth page is not requested'
+    pages = list(islice(piter, 4))
+    assert [len(page.filing_list) for page in pages] == [2, 2, 2], (
+        '3 pages of 2 unique filings, no fourth page requested')
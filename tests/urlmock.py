@@ -2,23 +2,38 @@
 Define class `UrlMock` for test fixture `urlmock`.
 
 .. note::
-    Method `apply` uses beta feature `responses._add_from_file` (as of
-    `responses` version 0.23.3).
+    Method `apply` reads mock files in the format of beta feature
+    `responses._add_from_file` (as of `responses` version 0.23.3).
 """
 
 # SPDX-FileCopyrightText: 2023 Lauri Salmela <lauri.m.salmela@gmail.com>
 #
 # SPDX-License-Identifier: MIT
 
+import functools
 from pathlib import Path
 from types import ModuleType
 from typing import Union
 
 import responses
+import yaml
 
 MOCK_URL_PATH = Path(__file__).parent / 'mock_responses'
 
 
+@functools.cache
+def _load_mock_file(file_path: str) -> tuple[dict, ...]:
+    """
+    Load the responses of a mock file once per test session.
+
+    The returned dicts are shared by all callers and must not be
+    mutated.
+    """
+    with open(file_path, encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    return tuple(item['response'] for item in data['responses'])
+
+
 class UrlMock:
     """Define operations for URL mock responses."""
 
@@ -28,8 +43,11 @@ class UrlMock:
         """
         Apply the mock URL response on the test for requests library.
 
-        This method uses beta feature `responses._add_from_file` (as of
-        `responses` version 0.23.3).
+        The file is parsed only on the first call for each mock and
+        the responses are registered the same way as beta feature
+        `responses._add_from_file` does (as of `responses` version
+        0.23.3). The cached response dicts are shared between calls
+        and must not be mutated.
 
         Parameters
         ----------
@@ -46,7 +64,16 @@ class UrlMock:
                 'not yet downloaded mocks.'
                 )
             raise Exception(msg)
-        rsps._add_from_file(file_path)
+        for rsp in _load_mock_file(file_path):
+            rsps.add(
+                method=rsp['method'],
+                url=rsp['url'],
+                body=rsp['body'],
+                status=rsp['status'],
+                content_type=rsp['content_type'],
+                auto_calculate_content_length=(
+                    rsp['auto_calculate_content_length'])
+                )
 
     def path(self, urlmock_name: str):
         """